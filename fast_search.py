@@ -17,14 +17,22 @@ import argparse
 import string
 import time
 import json
+import csv
 import platform
 import logging
+import functools
+import ctypes
+import hashlib
+import sqlite3
+import zlib
+from stat import S_ISREG
 from pathlib import Path
-from typing import List, Optional, Tuple, Set, Dict, Any
-from dataclasses import dataclass, asdict
+from typing import List, Optional, Tuple, Set, Dict, Any, Iterable, Iterator
+from dataclasses import dataclass, asdict, replace
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Thread, Event
+from threading import Thread, Event, Lock, Timer
+from itertools import islice
 import re
 
 # ================================
@@ -32,11 +40,20 @@ import re
 # ================================
 VERSION = "2.0.0"
 DEFAULT_MAX_RESULTS = 1000
+CPU_COUNT = os.cpu_count() or 4
+STAT_WORKERS = 32
+SCANDIR_MIN_HITS = 4
+PREVIEW_BYTES = 16384
 CONFIG_PATH = Path.home() / ".fastsearch.json"
 LOG_PATH = Path.home() / ".fastsearch.log"
+CACHE_PATH = Path.home() / ".fastsearch.cache.db"
+RESULT_CACHE_TTL = 60  # seconds
+RESULT_CACHE_SIZE = 100
+SERVICE_CHECK_TTL = 300  # seconds
 IS_WINDOWS = platform.system() == "Windows"
 IS_MACOS = platform.system() == "Darwin"
 IS_LINUX = platform.system() == "Linux"
+USERNAME = os.getenv("USERNAME" if IS_WINDOWS else "USER", "")
 
 COMMON_FOLDERS = [
     "Desktop",
@@ -50,6 +67,27 @@ COMMON_FOLDERS = [
     "Dropbox",
 ]
 
+# OS-managed top-level folders a full-drive scan never needs to walk
+SYSTEM_FOLDERS = (
+    [
+        "$Recycle.Bin",
+        "System Volume Information",
+        "$SysReset",
+        "$WinREAgent",
+        "Config.Msi",
+    ]
+    if IS_WINDOWS
+    else ["proc", "sys", "dev", "run", "snap"]
+)
+
+# Swap and hibernation files on the drive roots: huge, and locked while
+# the OS runs, so the drive-root pass leaves them alone
+SYSTEM_FILES = (
+    ["hiberfil.sys", "pagefile.sys", "swapfile.sys"]
+    if IS_WINDOWS
+    else ["swapfile", "swap.img"]
+)
+
 # Size constants (bytes)
 SIZE_UNITS = {
     "kb": 1024,
@@ -57,6 +95,48 @@ SIZE_UNITS = {
     "gb": 1024 * 1024 * 1024,
 }
 
+# File type labels by extension
+FILE_ICONS = {
+    ".pdf": "PDF",
+    ".docx": "Word",
+    ".doc": "Word",
+    ".xlsx": "Excel",
+    ".xls": "Excel",
+    ".pptx": "PPT",
+    ".py": "Python",
+    ".js": "JS",
+    ".ts": "TS",
+    ".java": "Java",
+    ".cpp": "C++",
+    ".c": "C",
+    ".html": "HTML",
+    ".css": "CSS",
+    ".jpg": "Image",
+    ".jpeg": "Image",
+    ".png": "Image",
+    ".gif": "Image",
+    ".svg": "SVG",
+    ".mp4": "Video",
+    ".avi": "Video",
+    ".mkv": "Video",
+    ".mp3": "Music",
+    ".wav": "Music",
+    ".flac": "Music",
+    ".zip": "Archive",
+    ".rar": "Archive",
+    ".7z": "Archive",
+    ".tar": "Archive",
+    ".gz": "Archive",
+    ".txt": "Text",
+    ".log": "Log",
+    ".json": "JSON",
+    ".xml": "XML",
+    ".yaml": "YAML",
+    ".md": "Markdown",
+    ".sql": "SQL",
+    ".db": "Database",
+}
+
 # Setup logging
 logging.basicConfig(
     filename=LOG_PATH,
@@ -92,6 +172,19 @@ class SearchFilters:
     created_after: Optional[datetime] = None
     created_before: Optional[datetime] = None
 
+    @property
+    def active(self) -> bool:
+        return any(
+            (
+                self.min_size,
+                self.max_size,
+                self.modified_after,
+                self.modified_before,
+                self.created_after,
+                self.created_before,
+            )
+        )
+
 
 # ================================
 # SPINNER
@@ -126,8 +219,8 @@ class Spinner:
 # ================================
 # CONFIG MANAGEMENT
 # ================================
-def load_config() -> dict:
-    default_config = {
+def get_default_config() -> dict:
+    return {
         "max_results": DEFAULT_MAX_RESULTS,
         "exclude": ["node_modules", ".git", "__pycache__", "*.tmp"],
         "extra_folders": [],
@@ -135,18 +228,37 @@ def load_config() -> dict:
         "history": [],
     }
 
-    if not CONFIG_PATH.exists():
+
+def load_config() -> dict:
+    """Load config, reparsing only when the file changed on disk"""
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    return _load_config(mtime)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config(mtime: Optional[int]) -> dict:
+    default_config = get_default_config()
+
+    if mtime is None:
         save_config(default_config)
         return default_config
 
     try:
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            config = json.load(f)
-            # Merge with defaults
-            for key, value in default_config.items():
-                if key not in config:
-                    config[key] = value
-            return config
+        data = CONFIG_PATH.read_bytes()
+        try:
+            import orjson
+
+            config = orjson.loads(data)
+        except ImportError:
+            config = json.loads(data)
+        # Merge with defaults
+        for key, value in default_config.items():
+            if key not in config:
+                config[key] = value
+        return config
     except Exception as e:
         logging.error(f"Config load failed: {e}")
         print(f"[Warning] Config load failed: {e}", file=sys.stderr)
@@ -161,6 +273,8 @@ def save_config(config: dict):
     except Exception as e:
         logging.error(f"Config save failed: {e}")
         print(f"[Warning] Config save failed: {e}", file=sys.stderr)
+    _load_config.cache_clear()
+    get_search_roots.cache_clear()
 
 
 def show_config(config: dict):
@@ -261,17 +375,8 @@ def edit_config_interactive(config: dict):
     elif choice == "7":
         confirm = input("Reset all settings? [y/N]: ").strip().lower()
         if confirm == "y":
-            default = load_config.__defaults__  # Won't work, need to rewrite
             config.clear()
-            config.update(
-                {
-                    "max_results": DEFAULT_MAX_RESULTS,
-                    "exclude": ["node_modules", ".git", "__pycache__", "*.tmp"],
-                    "extra_folders": [],
-                    "apps": {},
-                    "history": [],
-                }
-            )
+            config.update(get_default_config())
             save_config(config)
             print("✓ Reset to defaults!")
 
@@ -335,29 +440,197 @@ def show_history(config: dict):
     return None
 
 
+# ================================
+# EVERYTHING SDK
+# ================================
+class EverythingClient:
+    """In-process Everything queries through the SDK DLL (no es.exe launch)"""
+
+    def __init__(self, dll_path: str):
+        dll = ctypes.WinDLL(dll_path)
+        dll.Everything_SetSearchW.argtypes = [ctypes.c_wchar_p]
+        dll.Everything_SetMax.argtypes = [ctypes.c_uint32]
+        dll.Everything_QueryW.argtypes = [ctypes.c_int]
+        dll.Everything_QueryW.restype = ctypes.c_int
+        dll.Everything_GetNumResults.restype = ctypes.c_uint32
+        dll.Everything_GetLastError.restype = ctypes.c_uint32
+        dll.Everything_IsDBLoaded.restype = ctypes.c_int
+        dll.Everything_GetResultFullPathNameW.argtypes = [
+            ctypes.c_uint32,
+            ctypes.c_wchar_p,
+            ctypes.c_uint32,
+        ]
+        self.dll = dll
+        # The SDK keeps a single global query state
+        self.lock = Lock()
+
+    def wait_until_loaded(self, timeout: float = 10.0) -> bool:
+        """Poll until the service has its index in memory"""
+        deadline = time.monotonic() + timeout
+        while not self.dll.Everything_IsDBLoaded():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+        return True
+
+    def search(self, query: str, max_results: Optional[int] = None) -> List[str]:
+        with self.lock:
+            self.dll.Everything_SetSearchW(query)
+            self.dll.Everything_SetMax(max_results or 0xFFFFFFFF)
+            if not self.dll.Everything_QueryW(True):
+                raise OSError(
+                    f"Everything query failed (error {self.dll.Everything_GetLastError()})"
+                )
+            buf = ctypes.create_unicode_buffer(32768)
+            paths = []
+            for i in range(self.dll.Everything_GetNumResults()):
+                self.dll.Everything_GetResultFullPathNameW(i, buf, len(buf))
+                paths.append(buf.value)
+            return paths
+
+
+@functools.lru_cache(maxsize=1)
+def get_everything_client(es_path: str) -> Optional[EverythingClient]:
+    """Load Everything64.dll from $EVERYTHING_SDK_DLL or next to es.exe, if present"""
+    dll_name = "Everything64.dll" if sys.maxsize > 2**32 else "Everything32.dll"
+    candidates = [
+        os.getenv("EVERYTHING_SDK_DLL", ""),
+        os.path.join(os.path.dirname(es_path), dll_name),
+    ]
+    for dll_path in candidates:
+        if dll_path and os.path.isfile(dll_path):
+            try:
+                client = EverythingClient(dll_path)
+                logging.info(f"Using Everything SDK: {dll_path}")
+                return client
+            except (OSError, AttributeError) as e:
+                logging.warning(f"Everything SDK unavailable ({dll_path}): {e}")
+    return None
+
+
+def everything_scope(roots: Iterable[str]) -> str:
+    """Everything search term restricting results to the given folders"""
+    terms = ['path:"' + r.rstrip("\\/") + '\\"' for r in roots]
+    return terms[0] if len(terms) == 1 else f"<{'|'.join(terms)}>"
+
+
+# Everything terms hiding SYSTEM_FOLDERS and SYSTEM_FILES (a term with a
+# backslash matches against the full path)
+_SYSTEM_TERMS = (
+    [f'!"\\{name}\\"' for name in SYSTEM_FOLDERS]
+    + [f'!"\\{name}"' for name in SYSTEM_FILES]
+    if IS_WINDOWS
+    else []
+)
+
+
+def everything_query(
+    es_path: str, terms: List[str], max_results: Optional[int] = None, timeout=60
+) -> Iterator[str]:
+    """Run an Everything search via the SDK when available, else via es.exe"""
+    client = get_everything_client(es_path)
+    if client:
+        try:
+            yield from client.search(" ".join(terms), max_results)
+            return
+        except OSError as e:
+            logging.warning(f"Everything SDK query failed, falling back to es.exe: {e}")
+
+    cmd = [es_path]
+    if max_results:
+        cmd.extend(["-n", str(max_results)])
+    yield from run_cmd(cmd + terms, timeout)
+
+
+# ================================
+# RESULT CACHE
+# ================================
+def result_cache_key(*parts) -> str:
+    raw = json.dumps(parts, default=str, sort_keys=True)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _result_cache_db() -> Optional[sqlite3.Connection]:
+    try:
+        db = sqlite3.connect(CACHE_PATH, timeout=1)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(key TEXT PRIMARY KEY, ts REAL NOT NULL, data BLOB NOT NULL)"
+        )
+        return db
+    except sqlite3.Error as e:
+        logging.warning(f"Result cache unavailable: {e}")
+        return None
+
+
+def get_cached_results(key: str) -> Optional[List[str]]:
+    """Results stored under key within the last RESULT_CACHE_TTL seconds"""
+    db = _result_cache_db()
+    if db is None:
+        return None
+    try:
+        row = db.execute(
+            "SELECT data FROM results WHERE key = ? AND ts >= ?",
+            (key, time.time() - RESULT_CACHE_TTL),
+        ).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else None
+    except (sqlite3.Error, zlib.error, ValueError) as e:
+        logging.warning(f"Result cache read failed: {e}")
+        return None
+
+
+def put_cached_results(key: str, results: List[str]):
+    db = _result_cache_db()
+    if db is None:
+        return
+    now = time.time()
+    # Paths share long prefixes, so they compress several times over
+    data = zlib.compress(json.dumps(results).encode("utf-8"))
+    try:
+        with db:
+            db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)", (key, now, data)
+            )
+            db.execute(
+                "DELETE FROM results WHERE ts < ? OR key NOT IN "
+                "(SELECT key FROM results ORDER BY ts DESC LIMIT ?)",
+                (now - RESULT_CACHE_TTL, RESULT_CACHE_SIZE),
+            )
+    except sqlite3.Error as e:
+        logging.warning(f"Result cache save failed: {e}")
+
+
 # ================================
 # TOOLS: AUTO-INSTALL
 # ================================
+def run_installer(cmd: List[str], name: str, timeout: Optional[int] = None):
+    """Run a package manager command; raise RuntimeError if it fails"""
+    # Output goes straight to the terminal so a long install shows progress
+    result = subprocess.run(cmd, check=False, timeout=timeout)
+    if result.returncode:
+        logging.error(f"Failed to install {name}: exit code {result.returncode}")
+        raise RuntimeError(f"{cmd[0]} exited with {result.returncode} for {name}")
+    logging.info(f"Installed {name} via {cmd[0]}")
+
+
 def install_winget_tool(id: str, exe: str) -> str:
     print(f"   [Installing] {exe} via winget...")
-    try:
-        subprocess.run(
-            [
-                "winget",
-                "install",
-                "--id",
-                id,
-                "--silent",
-                "--accept-package-agreements",
-                "--accept-source-agreements",
-            ],
-            check=True,
-            timeout=300,
-        )
-        logging.info(f"Installed {exe} via winget")
-    except Exception as e:
-        logging.error(f"Failed to install {exe}: {e}")
-        raise
+    run_installer(
+        [
+            "winget",
+            "install",
+            "--id",
+            id,
+            "--silent",
+            "--accept-package-agreements",
+            "--accept-source-agreements",
+        ],
+        exe,
+        timeout=300,
+    )
 
     path = shutil.which(exe)
     if not path:
@@ -367,45 +640,179 @@ def install_winget_tool(id: str, exe: str) -> str:
 
 def install_brew_tool(name: str) -> str:
     print(f"   [Installing] {name} via brew...")
-    try:
-        subprocess.run(["brew", "install", name], check=True)
-        logging.info(f"Installed {name} via brew")
-    except Exception as e:
-        logging.error(f"Failed to install {name}: {e}")
-        raise
+    run_installer(["brew", "install", name], name)
     return shutil.which(name)
 
 
 def install_apt_tool(name: str) -> str:
     print(f"   [Installing] {name} via apt...")
-    try:
-        subprocess.run(["sudo", "apt", "update", "-qq"], check=True)
-        subprocess.run(["sudo", "apt", "install", "-y", name], check=True)
-        logging.info(f"Installed {name} via apt")
-
-        # Handle fd-find -> fd alias on Linux
-        if name == "fd-find":
-            fd_path = shutil.which("fdfind")
-            if fd_path and not shutil.which("fd"):
-                # Try to create symlink
-                try:
-                    link_path = Path(fd_path).parent / "fd"
-                    if not link_path.exists():
-                        subprocess.run(
-                            ["sudo", "ln", "-s", fd_path, str(link_path)], check=False
-                        )
-                except:
-                    pass
-            return shutil.which("fd") or shutil.which("fdfind")
+    # One sudo, one apt lock; noninteractive so debconf never prompts. env
+    # sets it after sudo, so sudoers env_reset can't strip or reject it
+    run_installer(
+        [
+            "sudo",
+            "env",
+            "DEBIAN_FRONTEND=noninteractive",
+            "sh",
+            "-c",
+            'apt-get update -qq && apt-get install -y -qq "$1"',
+            "sh",
+            name,
+        ],
+        name,
+    )
 
-    except Exception as e:
-        logging.error(f"Failed to install {name}: {e}")
-        raise
+    # Handle fd-find -> fd alias on Linux
+    if name == "fd-find":
+        fd_path = shutil.which("fdfind")
+        if fd_path and not shutil.which("fd"):
+            # Try to create symlink
+            try:
+                link_path = Path(fd_path).parent / "fd"
+                if not link_path.exists():
+                    subprocess.run(
+                        ["sudo", "ln", "-s", fd_path, str(link_path)], check=False
+                    )
+            except:
+                pass
+        return shutil.which("fd") or shutil.which("fdfind")
 
     return shutil.which(name.replace("-find", ""))
 
 
-def ensure_tools() -> Tools:
+# Service Control Manager constants (winsvc.h)
+SC_MANAGER_CONNECT = 0x0001
+SERVICE_QUERY_STATUS = 0x0004
+SERVICE_START = 0x0010
+SERVICE_RUNNING = 0x0004
+SC_STATUS_PROCESS_INFO = 0
+
+
+class SERVICE_STATUS_PROCESS(ctypes.Structure):
+    _fields_ = [
+        ("dwServiceType", ctypes.c_uint32),
+        ("dwCurrentState", ctypes.c_uint32),
+        ("dwControlsAccepted", ctypes.c_uint32),
+        ("dwWin32ExitCode", ctypes.c_uint32),
+        ("dwServiceSpecificExitCode", ctypes.c_uint32),
+        ("dwCheckPoint", ctypes.c_uint32),
+        ("dwWaitHint", ctypes.c_uint32),
+        ("dwProcessId", ctypes.c_uint32),
+        ("dwServiceFlags", ctypes.c_uint32),
+    ]
+
+
+def ensure_everything_service(timeout: float = 5.0) -> bool:
+    """Start the Everything service if needed; True once it is running"""
+    advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+    advapi32.OpenSCManagerW.restype = ctypes.c_void_p
+    advapi32.OpenSCManagerW.argtypes = [
+        ctypes.c_wchar_p,
+        ctypes.c_wchar_p,
+        ctypes.c_uint32,
+    ]
+    advapi32.OpenServiceW.restype = ctypes.c_void_p
+    advapi32.OpenServiceW.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_wchar_p,
+        ctypes.c_uint32,
+    ]
+    advapi32.QueryServiceStatusEx.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_int,
+        ctypes.c_void_p,
+        ctypes.c_uint32,
+        ctypes.POINTER(ctypes.c_uint32),
+    ]
+    advapi32.StartServiceW.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_uint32,
+        ctypes.c_void_p,
+    ]
+    advapi32.CloseServiceHandle.argtypes = [ctypes.c_void_p]
+
+    def is_running(service) -> bool:
+        status = SERVICE_STATUS_PROCESS()
+        needed = ctypes.c_uint32()
+        if not advapi32.QueryServiceStatusEx(
+            service,
+            SC_STATUS_PROCESS_INFO,
+            ctypes.byref(status),
+            ctypes.sizeof(status),
+            ctypes.byref(needed),
+        ):
+            raise ctypes.WinError(ctypes.get_last_error())
+        return status.dwCurrentState == SERVICE_RUNNING
+
+    scm = advapi32.OpenSCManagerW(None, None, SC_MANAGER_CONNECT)
+    if not scm:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        service = advapi32.OpenServiceW(
+            scm, "Everything", SERVICE_QUERY_STATUS | SERVICE_START
+        )
+        if not service:
+            # Starting needs rights a normal user may lack; querying does not
+            service = advapi32.OpenServiceW(scm, "Everything", SERVICE_QUERY_STATUS)
+        if not service:
+            raise ctypes.WinError(ctypes.get_last_error())
+        try:
+            if is_running(service):
+                return True
+            print("   [Starting Everything service...]")
+            if not advapi32.StartServiceW(service, 0, None):
+                logging.warning(
+                    f"StartService failed: {ctypes.WinError(ctypes.get_last_error())}"
+                )
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                if is_running(service):
+                    return True
+                time.sleep(0.05)
+            return False
+        finally:
+            advapi32.CloseServiceHandle(service)
+    finally:
+        advapi32.CloseServiceHandle(scm)
+
+
+def check_everything(es_path: str):
+    """Make sure the Everything service is up and report its index state"""
+    try:
+        if not ensure_everything_service():
+            print("   [Warning] Everything service may not be running")
+        else:
+            client = get_everything_client(es_path)
+            if client and not client.wait_until_loaded():
+                print("   [Info] Everything is still loading its index")
+    except Exception as e:
+        logging.warning(f"Could not check Everything service: {e}")
+
+    try:
+        status = subprocess.check_output(
+            [es_path, "-get-index-status"], text=True, timeout=5
+        ).strip()
+        print(f"   [Info] Everything index: {status}")
+    except:
+        print(f"   [Info] Everything index: unknown")
+
+
+def ensure_tools(config: dict) -> Tools:
+    # Paths found on an earlier run cost one stat each instead of a PATH walk
+    cache = config.get("tools_cache", {})
+    cached = (cache.get("filename"), cache.get("content"))
+    if all(path and os.path.isfile(path) for path in cached):
+        tools = Tools(*cached)
+        print(f"   [OK] Filename: {Path(tools.filename_tool).name}")
+        print(f"   [OK] Content: rg")
+        if IS_WINDOWS and (
+            time.time() - cache.get("service_checked", 0) > SERVICE_CHECK_TTL
+        ):
+            check_everything(tools.filename_tool)
+            cache["service_checked"] = time.time()
+            save_config(config)
+        return tools
+
     es_path = rg_path = fd_path = None
 
     if IS_WINDOWS:
@@ -430,24 +837,6 @@ def ensure_tools() -> Tools:
         if not es_path:
             es_path = install_winget_tool("voidtools.Everything", "es.exe")
 
-        # Start Everything service
-        try:
-            result = subprocess.run(
-                ["sc", "query", "Everything"], capture_output=True, text=True
-            )
-            if "RUNNING" not in result.stdout:
-                print("   [Starting Everything service...]")
-                subprocess.run(["net", "start", "Everything"], check=False)
-                time.sleep(3)
-                # Verify it started
-                result = subprocess.run(
-                    ["sc", "query", "Everything"], capture_output=True, text=True
-                )
-                if "RUNNING" not in result.stdout:
-                    print("   [Warning] Everything service may not be running")
-        except Exception as e:
-            logging.warning(f"Could not check Everything service: {e}")
-
         # ripgrep
         rg_path = shutil.which("rg") or install_winget_tool(
             "BurntSushi.ripgrep.MSVC", "rg"
@@ -472,112 +861,230 @@ def ensure_tools() -> Tools:
     print(f"   [OK] Filename: {Path(filename_tool).name}")
     print(f"   [OK] Content: rg")
 
-    # Indexing status
+    # Start Everything service and report indexing status
     if IS_WINDOWS and es_path:
-        try:
-            status = subprocess.check_output(
-                [es_path, "-get-index-status"], text=True, timeout=5
-            ).strip()
-            print(f"   [Info] Everything index: {status}")
-        except:
-            print(f"   [Info] Everything index: unknown")
+        check_everything(es_path)
 
+    config["tools_cache"] = {
+        "filename": filename_tool,
+        "content": content_tool,
+        "service_checked": time.time(),
+    }
+    save_config(config)
     return Tools(filename_tool, content_tool)
 
 
 # ================================
 # UTILS
 # ================================
+# Console constants (wincon.h)
+STD_OUTPUT_HANDLE = -11
+ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+
+@functools.lru_cache(maxsize=1)
+def _console_supports_ansi() -> bool:
+    """Turn on ANSI escape handling in the Windows console (once)"""
+    if not IS_WINDOWS:
+        return True
+    try:
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        mode.value |= ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode))
+    except (AttributeError, OSError):
+        return False
+
+
 def clear_screen():
-    os.system("cls" if IS_WINDOWS else "clear")
+    # An escape sequence instead of spawning a shell for cls/clear
+    if _console_supports_ansi():
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+    else:
+        os.system("cls")
+
 
+def open_detached(cmd: List[str]):
+    """Launch an opener in its own session without waiting for it"""
+    subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
 
-def run_cmd(cmd, timeout=60) -> List[str]:
+
+# Child processes started by run_cmd, so a search can stop them early
+_running_procs: Set[subprocess.Popen] = set()
+_running_procs_lock = Lock()
+
+
+def run_cmd(cmd, timeout=60) -> Iterator[str]:
+    """Yield non-empty output lines as the command produces them.
+
+    The process is killed after timeout seconds, and terminated if the
+    caller stops iterating early.
+    """
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            timeout=timeout,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            # Large reads keep per-line overhead low on drive-wide scans
+            bufsize=1 << 20,
         )
-        return [
-            line.strip() for line in result.stdout.strip().splitlines() if line.strip()
-        ]
-    except subprocess.TimeoutExpired:
-        logging.warning(f"Command timeout: {' '.join(cmd)}")
-        print(f"[Warning] Search timed out after {timeout}s", file=sys.stderr)
-        return []
     except Exception as e:
         logging.error(f"Command failed: {e}")
         print(f"[Warning] Cmd failed: {e}", file=sys.stderr)
-        return []
+        return
+
+    timed_out = Event()
+
+    def kill_on_timeout():
+        timed_out.set()
+        proc.kill()
+
+    timer = Timer(timeout, kill_on_timeout)
+    timer.daemon = True
+    with _running_procs_lock:
+        _running_procs.add(proc)
+    timer.start()
+    try:
+        # Read raw bytes and decode per line; skips the text-mode wrapper
+        for raw in proc.stdout:
+            line = raw.decode("utf-8", "replace").strip()
+            if line:
+                yield line
+        if timed_out.is_set():
+            logging.warning(f"Command timeout: {' '.join(cmd)}")
+            print(f"[Warning] Search timed out after {timeout}s", file=sys.stderr)
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.terminate()
+        proc.stdout.close()
+        proc.wait()
+        with _running_procs_lock:
+            _running_procs.discard(proc)
+
+
+def terminate_running_cmds():
+    """Stop every child process still running under run_cmd"""
+    with _running_procs_lock:
+        procs = list(_running_procs)
+    for proc in procs:
+        try:
+            proc.terminate()
+        except OSError:
+            pass
 
 
-def get_drives() -> List[str]:
+@functools.lru_cache(maxsize=1)
+def get_drives() -> Tuple[str, ...]:
     if IS_WINDOWS:
-        return [f"{d}:\\" for d in string.ascii_uppercase if os.path.exists(f"{d}:\\")]
+        # One bitmask call instead of a stat per drive letter
+        mask = ctypes.windll.kernel32.GetLogicalDrives()
+        return tuple(
+            f"{d}:\\" for i, d in enumerate(string.ascii_uppercase) if mask & (1 << i)
+        )
     else:
-        return ["/"]
+        return ("/",)
+
+
+@functools.lru_cache(maxsize=1)
+def get_drive_roots() -> Tuple[str, ...]:
+    """Top-level folders of every drive, minus SYSTEM_FOLDERS
+
+    Files sitting directly on a drive are not included; scan the drives
+    themselves with a depth of 1 to pick those up.
+    """
+    skip = {os.path.normcase(name) for name in SYSTEM_FOLDERS}
+    roots = []
+    links = []
+    for drive in get_drives():
+        try:
+            with os.scandir(drive) as entries:
+                for e in entries:
+                    if os.path.normcase(e.name) in skip or not e.is_dir():
+                        continue
+                    (links if e.is_symlink() else roots).append(e.path)
+        except OSError:
+            roots.append(drive)
+    # A linked folder is walked only when its target isn't already under
+    # another root: /bin -> usr/bin is, /home -> /mnt/data/home isn't
+    covered = [os.path.join(os.path.realpath(r), "") for r in roots]
+    for link in links:
+        target = os.path.join(os.path.realpath(link), "")
+        if not any(target.startswith(r) for r in covered):
+            roots.append(link)
+    return tuple(roots)
+
+
+@functools.lru_cache(maxsize=65536)
+def stat_path(path: str) -> Optional[os.stat_result]:
+    """Stat a result once; filters, details and export share the answer"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _scandir_stats(folder: str, paths: List[str]) -> Dict[str, os.stat_result]:
+    """Stats for paths inside folder, read from a single directory listing"""
+    wanted = {os.path.normcase(os.path.basename(p)): p for p in paths}
+    stats = {}
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                path = wanted.get(os.path.normcase(entry.name))
+                if path is not None:
+                    stats[path] = entry.stat()
+    except OSError as e:
+        logging.warning(f"Listing {folder} failed: {e}")
+    return stats
+
+
+def stat_all(paths: List[str]) -> List[Optional[os.stat_result]]:
+    """Stat many paths concurrently; each stat is an independent IO wait"""
+    if len(paths) < 2:
+        return [stat_path(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=STAT_WORKERS) as executor:
+        if not IS_WINDOWS:
+            return list(executor.map(stat_path, paths))
+
+        # Windows directory listings carry size and times, so folders
+        # holding several results are read once instead of stat'ing each
+        by_dir: Dict[str, List[str]] = {}
+        for path in paths:
+            by_dir.setdefault(os.path.dirname(path), []).append(path)
+        crowded = [(d, ps) for d, ps in by_dir.items() if len(ps) >= SCANDIR_MIN_HITS]
+        stats: Dict[str, Optional[os.stat_result]] = {}
+        for found in executor.map(lambda item: _scandir_stats(*item), crowded):
+            stats.update(found)
+        rest = [path for path in paths if path not in stats]
+        stats.update(zip(rest, executor.map(stat_path, rest)))
+    return [stats.get(path) for path in paths]
 
 
 def get_file_icon(path: str) -> str:
     """Get icon label for file type"""
-    ext = Path(path).suffix.lower()
-    icons = {
-        ".pdf": "PDF",
-        ".docx": "Word",
-        ".doc": "Word",
-        ".xlsx": "Excel",
-        ".xls": "Excel",
-        ".pptx": "PPT",
-        ".py": "Python",
-        ".js": "JS",
-        ".ts": "TS",
-        ".java": "Java",
-        ".cpp": "C++",
-        ".c": "C",
-        ".html": "HTML",
-        ".css": "CSS",
-        ".jpg": "Image",
-        ".jpeg": "Image",
-        ".png": "Image",
-        ".gif": "Image",
-        ".svg": "SVG",
-        ".mp4": "Video",
-        ".avi": "Video",
-        ".mkv": "Video",
-        ".mp3": "Music",
-        ".wav": "Music",
-        ".flac": "Music",
-        ".zip": "Archive",
-        ".rar": "Archive",
-        ".7z": "Archive",
-        ".tar": "Archive",
-        ".gz": "Archive",
-        ".txt": "Text",
-        ".log": "Log",
-        ".json": "JSON",
-        ".xml": "XML",
-        ".yaml": "YAML",
-        ".md": "Markdown",
-        ".sql": "SQL",
-        ".db": "Database",
-    }
-    return icons.get(ext, "File")
+    return FILE_ICONS.get(os.path.splitext(path)[1].lower(), "File")
 
 
 def format_file_info(path: str) -> str:
     """Format file path with icon and size"""
     try:
-        p = Path(path)
-        if not p.exists():
+        st = stat_path(path)
+        if st is None:
             return f"{path} [Missing]"
 
         icon = get_file_icon(path)
-        size = p.stat().st_size
-        size_str = format_size(size)
+        size_str = format_size(st.st_size)
         return f"{path} [{icon}, {size_str}]"
     except Exception as e:
         return f"{path} [Error: {e}]"
@@ -595,19 +1102,22 @@ def format_size(size: int) -> str:
         return f"{size / (1024 * 1024 * 1024):.2f}GB"
 
 
+_SIZE_RE = re.compile(r"(\d+(?:\.\d+)?)(kb|mb|gb)?")
+_DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%d-%m-%Y", "%m/%d/%Y")
+
+
 def parse_size(size_str: str) -> Optional[int]:
     """Parse size string like '10mb' to bytes"""
     if not size_str:
         return None
-    size_str = size_str.lower().strip()
-    match = re.match(r"(\d+(?:\.\d+)?)(kb|mb|gb)?", size_str)
+    match = _SIZE_RE.match(size_str.lower().strip())
     if not match:
         return None
     value, unit = match.groups()
-    value = float(value)
-    if unit:
-        value *= SIZE_UNITS.get(unit, 1)
-    return int(value)
+    multiplier = SIZE_UNITS.get(unit, 1)
+    if "." in value:
+        return int(float(value) * multiplier)
+    return int(value) * multiplier
 
 
 def parse_date(date_str: str) -> Optional[datetime]:
@@ -624,13 +1134,15 @@ def parse_date(date_str: str) -> Optional[datetime]:
     elif date_str.endswith("d"):  # e.g., "7d" = 7 days ago
         try:
             days = int(date_str[:-1])
-            return datetime.now() - timedelta(days=days)
+            # Whole minutes, so repeat searches share a result cache key
+            return (datetime.now() - timedelta(days=days)).replace(
+                second=0, microsecond=0
+            )
         except ValueError:
             pass
 
     # Absolute dates
-    formats = ["%Y-%m-%d", "%Y/%m/%d", "%d-%m-%Y", "%m/%d/%Y"]
-    for fmt in formats:
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
@@ -639,51 +1151,60 @@ def parse_date(date_str: str) -> Optional[datetime]:
     return None
 
 
-def fuzzy_match(user_input: str, options: List[str]) -> Optional[str]:
-    """Fuzzy match user input to options"""
-    user_input = user_input.lower().strip()
-    for opt in options:
-        if opt.lower().startswith(user_input):
-            return opt
-    return None
-
-
 # ================================
 # EXCLUDE & PATTERN
 # ================================
+@functools.lru_cache(maxsize=8)
+def compile_exclude(
+    patterns: Tuple[str, ...],
+) -> Tuple[frozenset, Optional[re.Pattern]]:
+    """Split excludes into plain folder/file names and one regex for the rest"""
+    names = set()
+    alternatives = []
+    for pattern in patterns:
+        glob = pattern.replace("\\", "/").strip("/")
+        if not glob:
+            continue
+        if not any(c in glob for c in "*?/"):
+            names.add(glob.lower() if IS_WINDOWS else glob)
+            continue
+        regex = re.escape(glob).replace(r"\*", "[^/]*").replace(r"\?", "[^/]")
+        alternatives.append(regex)
+    regex = None
+    if alternatives:
+        flags = re.IGNORECASE if IS_WINDOWS else 0
+        regex = re.compile(f"(?:^|/)(?:{'|'.join(alternatives)})(?:/|$)", flags)
+    return frozenset(names), regex
+
+
 def should_exclude(path: str, exclude: List[str]) -> bool:
-    p = Path(path)
-    for pattern in exclude:
-        # Direct match
-        if pattern in p.parts:
-            return True
-        # Glob match
-        try:
-            if p.match(pattern):
-                return True
-        except:
-            pass
-    return False
+    names, regex = compile_exclude(tuple(exclude))
+    path = path.replace("\\", "/")
+    if names and not names.isdisjoint(
+        (path.lower() if IS_WINDOWS else path).split("/")
+    ):
+        return True
+    return bool(regex and regex.search(path))
 
 
 def apply_filters(path: str, filters: SearchFilters) -> bool:
     """Check if file matches size/date filters"""
+    if not filters.active:
+        return True
     try:
-        p = Path(path)
-        if not p.exists() or not p.is_file():
+        st = stat_path(path)
+        if st is None or not S_ISREG(st.st_mode):
             return True
 
-        stat = p.stat()
-
         # Size filters
-        if filters.min_size and stat.st_size < filters.min_size:
+        if filters.min_size and st.st_size < filters.min_size:
             return False
-        if filters.max_size and stat.st_size > filters.max_size:
+        if filters.max_size and st.st_size > filters.max_size:
             return False
 
         # Date filters
-        mtime = datetime.fromtimestamp(stat.st_mtime)
-        ctime = datetime.fromtimestamp(stat.st_ctime)
+        mtime = datetime.fromtimestamp(st.st_mtime)
+        ctime = datetime.fromtimestamp(st.st_ctime)
 
         if filters.modified_after and mtime < filters.modified_after:
             return False
@@ -700,21 +1221,131 @@ def apply_filters(path: str, filters: SearchFilters) -> bool:
         return True
 
 
+def filters_to_es_terms(filters: SearchFilters) -> Tuple[List[str], SearchFilters]:
+    """Everything terms for the filters, plus what is left to check in Python"""
+    terms = []
+    if filters.min_size:
+        terms.append(f"size:>={filters.min_size}")
+    if filters.max_size:
+        terms.append(f"size:<={filters.max_size}")
+    # Everything compares whole days, so date terms only prune and
+    # apply_filters still checks the exact time
+    for prefix, after, before in (
+        ("dm", filters.modified_after, filters.modified_before),
+        ("dc", filters.created_after, filters.created_before),
+    ):
+        if after:
+            terms.append(f"{prefix}:>={after:%Y-%m-%d}")
+        if before:
+            terms.append(f"{prefix}:<={before:%Y-%m-%d}")
+    return terms, replace(filters, min_size=None, max_size=None)
+
+
+def filters_to_fd_args(filters: SearchFilters) -> Tuple[List[str], SearchFilters]:
+    """fd flags for the filters, plus what is left to check in Python"""
+    args = []
+    if filters.min_size:
+        args += ["--size", f"+{filters.min_size}b"]
+    if filters.max_size:
+        args += ["--size", f"-{filters.max_size}b"]
+    if filters.modified_after:
+        args += ["--changed-within", f"{filters.modified_after:%Y-%m-%d %H:%M:%S}"]
+    if filters.modified_before:
+        args += ["--changed-before", f"{filters.modified_before:%Y-%m-%d %H:%M:%S}"]
+    # fd has no creation-time filter
+    residual = replace(
+        filters,
+        min_size=None,
+        max_size=None,
+        modified_after=None,
+        modified_before=None,
+    )
+    return args, residual
+
+
+# Classifies a filename query in one pass; alternatives are tried in order
+_QUERY_KIND_RE = re.compile(
+    r"(?P<raw>re:.*|.*[*?].*)"
+    r"|(?P<split>(?P<name>[^/]*)/(?P<ext>.*))"
+    r"|(?P<exact>.*\..*)"
+    r"|(?P<contains>.*)",
+    re.DOTALL,
+)
+
+
+@functools.lru_cache(maxsize=256)
 def build_everything_pattern(user_input: str) -> str:
     s = user_input.strip()
     if not s:
         return "*"
-    if "." in s and "/" not in s and "*" not in s and "?" not in s:
-        return s
-    if "*" in s or "?" in s or s.startswith("re:"):
+    m = _QUERY_KIND_RE.fullmatch(s)
+    kind = m.lastgroup
+    if kind in ("raw", "exact"):
         return s
-    if "/" in s:
-        name, ext = s.split("/", 1)
-        ext = ext.lstrip(".")
-        return f"*{name}*.{ext}" if ext else f"*{name}*"
+    if kind == "split":
+        ext = m["ext"].lstrip(".")
+        return f"*{m['name']}*.{ext}" if ext else f"*{m['name']}*"
     return f"*{s}*"
 
 
+@functools.lru_cache(maxsize=4)
+def get_search_roots(extra_folders: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Common user folders on every drive, then the configured extra folders"""
+    roots = []
+    seen = set()
+
+    def add(path: str):
+        key = os.path.normcase(path)
+        if key not in seen:
+            seen.add(key)
+            roots.append(path)
+
+    for drive in get_drives():
+        user_root = os.path.join(drive, "Users", USERNAME)
+        # One directory read per drive instead of a stat per common folder
+        try:
+            with os.scandir(user_root) as entries:
+                present = {
+                    os.path.normcase(e.name): e.name for e in entries if e.is_dir()
+                }
+        except OSError:
+            continue
+        for folder in COMMON_FOLDERS:
+            # Windows folder names are case-insensitive
+            name = present.get(os.path.normcase(folder))
+            if name:
+                add(os.path.join(user_root, name))
+
+    for extra in extra_folders:
+        if os.path.isabs(extra) and os.path.isdir(extra):
+            add(extra)
+    return tuple(roots)
+
+
+def chunk_args(args: List[str], budget: int = 30000) -> Iterator[List[str]]:
+    """Split args into batches that fit on one command line (32K chars on Windows)"""
+    chunk: List[str] = []
+    size = 0
+    for arg in args:
+        if chunk and size + len(arg) + 3 > budget:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(arg)
+        size += len(arg) + 3
+    if chunk:
+        yield chunk
+
+
+def add_unique(results: List[str], seen: Set[str], hits: Iterable[str], limit: int):
+    """Append hits not already in results, stopping once limit is reached"""
+    for h in hits:
+        if len(results) >= limit:
+            break
+        if h not in seen:
+            seen.add(h)
+            results.append(h)
+
+
 # ================================
 # FILENAME SEARCH
 # ================================
@@ -725,82 +1356,95 @@ def smart_search_filename(
     exclude = config.get("exclude", [])
     extra_folders = config.get("extra_folders", [])
     results: List[str] = []
-    scanned: Set[str] = set()
+    seen: Set[str] = set()
 
     pattern = build_everything_pattern(query)
     print(f"   Pattern → {pattern}")
+    if IS_WINDOWS and pattern.startswith("re:"):
+        # Everything spells its regex modifier "regex:"
+        pattern = "regex:" + pattern[3:]
 
-    def search_path(root: Path) -> List[str]:
-        if str(root) in scanned or not root.exists():
-            return []
-        scanned.add(str(root))
+    # Let the index prune by size/date; only the leftovers need a stat
+    if IS_WINDOWS:
+        filter_args, residual = filters_to_es_terms(filters)
+    else:
+        filter_args, residual = filters_to_fd_args(filters)
 
+    def find(
+        roots: Tuple[str, ...], timeout: int, limit: int, max_depth: Optional[int]
+    ) -> Iterator[str]:
+        if IS_WINDOWS:
+            # One Everything query ORs all the folders together
+            terms = [everything_scope(roots), pattern, *filter_args, *_SYSTEM_TERMS]
+            return everything_query(tools.filename_tool, terms, limit, timeout)
+        if pattern.startswith("re:"):
+            fd_pattern = [pattern[3:]]
+        else:
+            fd_pattern = ["--glob", pattern]
+        cmd = [
+            tools.filename_tool,
+            "--ignore-case",
+            *fd_pattern,
+            *roots,
+            "--max-results",
+            str(limit),
+            "--threads",
+            str(CPU_COUNT),
+            *filter_args,
+        ]
+        if max_depth:
+            cmd.extend(["--max-depth", str(max_depth)])
+            for name in SYSTEM_FILES:
+                cmd.extend(["--exclude", name])
+        return run_cmd(cmd, timeout)
+
+    def collect(roots: Tuple[str, ...], timeout: int, max_depth: Optional[int] = None):
         try:
-            if IS_WINDOWS:
-                cmd = [
-                    tools.filename_tool,
-                    "-path",
-                    str(root),
-                    "-n",
-                    str(max_res),
-                    pattern,
-                ]
-            else:
-                cmd = [
-                    tools.filename_tool,
-                    pattern,
-                    "--path",
-                    str(root),
-                    "--max-results",
-                    str(max_res),
-                ]
-
-            hits = run_cmd(cmd, 60)
-            hits = [
+            # A wider scan re-finds what we already have; ask for enough
+            # extra that the overlap can't crowd out new hits
+            hits = (
                 h
-                for h in hits
-                if not should_exclude(h, exclude) and apply_filters(h, filters)
-            ]
-            return hits
+                for h in find(roots, timeout, max_res + len(results), max_depth)
+                if h not in seen
+                and not should_exclude(h, exclude)
+                and apply_filters(h, residual)
+            )
+            add_unique(results, seen, islice(hits, max_res - len(results)), max_res)
         except Exception as e:
-            logging.error(f"Search failed for {root}: {e}")
-            return []
+            logging.error(f"Search failed for {', '.join(roots)}: {e}")
 
-    # Search common folders in parallel
-    search_roots = []
-    for drive in get_drives():
-        user_root = (
-            Path(drive) / "Users" / os.getenv("USERNAME" if IS_WINDOWS else "USER", "")
-        )
-        for folder in COMMON_FOLDERS:
-            p = user_root / folder
-            if p.exists():
-                search_roots.append(p)
-        for extra in extra_folders:
-            p = Path(extra)
-            if p.is_absolute() and p.exists():
-                search_roots.append(p)
-
-    spinner = Spinner("Searching common locations")
-    spinner.start()
+    # An exact file name is instant to look up across the whole Everything
+    # index, so skip the common-folder pass and the second query after it
+    whole_drive = (
+        IS_WINDOWS and _QUERY_KIND_RE.fullmatch(query.strip()).lastgroup == "exact"
+    )
+    if whole_drive:
+        search_roots = get_drives()
+    else:
+        # A single es/fd run covers every common folder
+        search_roots = get_search_roots(tuple(extra_folders))
 
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = {executor.submit(search_path, root): root for root in search_roots}
-        for future in as_completed(futures):
-            root = futures[future]
-            try:
-                hits = future.result()
-                results.extend(hits)
-                logging.info(f"Searched {root}: {len(hits)} hits")
-            except Exception as e:
-                logging.error(f"Search error for {root}: {e}")
+    cache_key = result_cache_key(
+        "filename", pattern, search_roots, max_res, exclude, asdict(filters)
+    )
+    cached = get_cached_results(cache_key)
+    if cached is not None:
+        add_unique(results, seen, cached, max_res)
+        print(f"   (cached from the last {RESULT_CACHE_TTL}s)")
+    else:
+        spinner = Spinner(
+            "Searching all drives" if whole_drive else "Searching common locations"
+        )
+        spinner.start()
+        collect(search_roots, 180 if whole_drive else 60)
+        logging.info(f"Searched {len(search_roots)} folders: {len(results)} hits")
+        spinner.stop()
+        put_cached_results(cache_key, results)
 
-    spinner.stop()
+    where = "on all drives" if whole_drive else "in common locations"
+    print(f"\n   Found {len(results)} {where}.")
 
-    results = list(dict.fromkeys(results))[:max_res]
-    print(f"\n   Found {len(results)} in common locations.")
-
-    if len(results) >= max_res:
+    if whole_drive or len(results) >= max_res:
         return results
 
     choice = (
@@ -811,103 +1455,144 @@ def smart_search_filename(
 
     spinner = Spinner("Scanning full drive(s)")
     spinner.start()
-
-    for drive in get_drives():
-        if IS_WINDOWS:
-            cmd = [tools.filename_tool, "-path", drive, "-n", str(max_res), pattern]
-        else:
-            cmd = [tools.filename_tool, pattern, "--max-results", str(max_res)]
-        hits = run_cmd(cmd, 180)
-        hits = [
-            h
-            for h in hits
-            if h not in results
-            and not should_exclude(h, exclude)
-            and apply_filters(h, filters)
-        ]
-        results.extend(hits)
-        if len(results) >= max_res:
-            break
-
+    if IS_WINDOWS:
+        # Everything scopes whole drives; _SYSTEM_TERMS hide the OS folders and files
+        collect(get_drives(), 180)
+    else:
+        # fd walks the top-level folders, then lists the drive roots themselves
+        collect(get_drive_roots(), 180)
+        collect(get_drives(), 60, max_depth=1)
     spinner.stop()
-    return list(dict.fromkeys(results))[:max_res]
+    return results
 
 
 # ================================
 # CONTENT SEARCH
 # ================================
+_REGEX_META_RE = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
 def smart_search_content(
     text: str, ext: Optional[str], tools: Tools, config: dict, filters: SearchFilters
 ) -> List[str]:
     max_res = config.get("max_results", DEFAULT_MAX_RESULTS)
     exclude = config.get("exclude", [])
     extra_folders = config.get("extra_folders", [])
-    results = []
-    scanned = set()
+    results: List[str] = []
+    seen: Set[str] = set()
 
     glob = f"*.{ext}" if ext and ext.strip() else None
-
-    def build_rg_cmd(root: str):
+    # With a type filter, Everything can list the candidate files so rg
+    # reads just those instead of walking every folder itself
+    use_index = bool(glob) and IS_WINDOWS and Path(tools.filename_tool).stem == "es"
+    # rg enforces the size cap itself; Everything prunes the candidate list
+    es_terms, residual = filters_to_es_terms(filters)
+    if not use_index:
+        residual = replace(filters, max_size=None)
+
+    # Plain text skips rg's regex engine for its literal searcher
+    literal = not _REGEX_META_RE.search(text)
+
+    def build_rg_cmd(
+        *paths: str, threads: int = CPU_COUNT, max_depth: Optional[int] = None
+    ):
         cmd = [
             tools.content_tool,
             "--files-with-matches",
             "--no-messages",
             "--ignore-case",
             "--follow",
+            "--threads",
+            str(threads),
             text,
-            root,
+            *paths,
         ]
+        if filters.max_size:
+            cmd.extend(["--max-filesize", str(filters.max_size)])
+        if max_depth:
+            cmd.extend(["--max-depth", str(max_depth)])
+            for name in SYSTEM_FILES:
+                cmd.extend(["--iglob" if IS_WINDOWS else "--glob", f"!{name}"])
+        if literal:
+            cmd.append("--fixed-strings")
         if glob:
             cmd.extend(["--glob", glob])
+        # Same case rules as should_exclude, so rg never opens excluded files
+        exclude_flag = "--iglob" if IS_WINDOWS else "--glob"
         for ex in exclude:
-            cmd.extend(["--glob", f"!{ex}"])
+            cmd.extend([exclude_flag, f"!{ex}"])
         return cmd
 
-    def search_path(root: Path) -> List[str]:
-        if str(root) in scanned or not root.exists():
-            return []
-        scanned.add(str(root))
+    def grep_paths(
+        roots: Tuple[str, ...], timeout: int, max_depth: Optional[int]
+    ) -> Iterator[str]:
+        if not use_index:
+            # rg walks all the roots in parallel on its own thread pool
+            yield from run_cmd(build_rg_cmd(*roots, max_depth=max_depth), timeout)
+            return
 
-        try:
-            hits = run_cmd(build_rg_cmd(str(root)), 180)
-            hits = [h for h in hits if apply_filters(h, filters)]
-            return hits
-        except Exception as e:
-            logging.error(f"Content search failed for {root}: {e}")
-            return []
+        terms = [everything_scope(roots), "file:", glob, *es_terms, *_SYSTEM_TERMS]
+        candidates = [
+            f
+            for f in everything_query(tools.filename_tool, terms)
+            if not should_exclude(f, exclude)
+        ]
+        chunks = list(chunk_args(candidates))
+        if len(chunks) <= 1:
+            for chunk in chunks:
+                yield from run_cmd(build_rg_cmd(*chunk), timeout)
+            return
 
-    search_roots = []
-    for drive in get_drives():
-        user_root = (
-            Path(drive) / "Users" / os.getenv("USERNAME" if IS_WINDOWS else "USER", "")
-        )
-        for folder in COMMON_FOLDERS:
-            path = user_root / folder
-            if path.exists():
-                search_roots.append(path)
-        for extra in extra_folders:
-            p = Path(extra)
-            if p.is_absolute() and p.exists():
-                search_roots.append(p)
-
-    spinner = Spinner("Searching file contents")
-    spinner.start()
+        # Each rg gets its own slice of the candidates; run them side by side
+        workers = min(CPU_COUNT, len(chunks))
+        threads = max(1, CPU_COUNT // workers)
+
+        def grep_chunk(chunk: List[str]) -> List[str]:
+            return list(run_cmd(build_rg_cmd(*chunk, threads=threads), timeout))
 
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = {executor.submit(search_path, root): root for root in search_roots}
-        for future in as_completed(futures):
-            root = futures[future]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(grep_chunk, chunk) for chunk in chunks]
             try:
-                hits = future.result()
-                results.extend(hits)
-                logging.info(f"Content searched {root}: {len(hits)} hits")
-            except Exception as e:
-                logging.error(f"Content search error for {root}: {e}")
+                for future in as_completed(futures):
+                    yield from future.result()
+            finally:
+                # Reached max_results (or failed): stop the remaining rg runs
+                for future in futures:
+                    future.cancel()
+                terminate_running_cmds()
+
+    def collect(roots: Tuple[str, ...], timeout: int, max_depth: Optional[int] = None):
+        try:
+            hits = (
+                h
+                for h in grep_paths(roots, timeout, max_depth)
+                if h not in seen
+                and not should_exclude(h, exclude)
+                and apply_filters(h, residual)
+            )
+            add_unique(results, seen, islice(hits, max_res - len(results)), max_res)
+        except Exception as e:
+            logging.error(f"Content search failed for {', '.join(roots)}: {e}")
 
-    spinner.stop()
+    search_roots = get_search_roots(tuple(extra_folders))
+
+    cache_key = result_cache_key(
+        "content", text, glob, search_roots, max_res, exclude, asdict(filters)
+    )
+    cached = get_cached_results(cache_key)
+    if cached is not None:
+        add_unique(results, seen, cached, max_res)
+        print(f"   (cached from the last {RESULT_CACHE_TTL}s)")
+    else:
+        spinner = Spinner("Searching file contents")
+        spinner.start()
+        collect(search_roots, 180)
+        logging.info(
+            f"Content searched {len(search_roots)} folders: {len(results)} hits"
+        )
+        spinner.stop()
+        put_cached_results(cache_key, results)
 
-    results = [r for r in results if not should_exclude(r, exclude)]
-    results = list(dict.fromkeys(results))[:max_res]
     print(f"\n   Found {len(results)} in common locations.")
 
     if len(results) >= max_res:
@@ -919,50 +1604,51 @@ def smart_search_content(
 
     spinner = Spinner("Scanning full drive(s)")
     spinner.start()
-
-    for drive in get_drives():
-        hits = run_cmd(build_rg_cmd(drive), 600)
-        hits = [
-            h
-            for h in hits
-            if h not in results
-            and not should_exclude(h, exclude)
-            and apply_filters(h, filters)
-        ]
-        results.extend(hits)
-        if len(results) >= max_res:
-            break
-
+    if use_index:
+        # Everything scopes whole drives; _SYSTEM_TERMS hide the OS folders and files
+        collect(get_drives(), 600)
+    else:
+        # rg walks the top-level folders, then the files on the drive roots
+        collect(get_drive_roots(), 600)
+        collect(get_drives(), 60, max_depth=1)
     spinner.stop()
-    return list(dict.fromkeys(results))[:max_res]
+    return results
 
 
 # ================================
 # RESULT DISPLAY
 # ================================
+# Selection input such as "1,3-5, 7"
+_SELECTION_RE = re.compile(r"(\d+)\s*(?:-\s*(\d+))?")
+
+
 def display_results(results: List[str], show_details: bool = False) -> List[str]:
     if not results:
         print("\nNo results.")
         return []
 
-    # Pre-compute formatted results
-    if show_details:
-        formatted = [(i, format_file_info(path)) for i, path in enumerate(results, 1)]
-    else:
-        formatted = [
-            (i, f"{path} [{get_file_icon(path)}]") for i, path in enumerate(results, 1)
-        ]
+    while True:
+        # Only the rows on screen get formatted (details mode stats each file)
+        shown = results[:50]
+        if show_details:
+            formatted = [format_file_info(path) for path in shown]
+        else:
+            formatted = [f"{path} [{get_file_icon(path)}]" for path in shown]
 
-    print(f"\n{len(results)} match(es):")
-    to_show = formatted[:50]
-    for i, display_text in to_show:
-        print(f"  {i:2}) {display_text}")
+        lines = [f"\n{len(results)} match(es):"]
+        lines.extend(f"  {i:2}) {text}" for i, text in enumerate(formatted, 1))
+        if len(results) > 50:
+            lines.append(f"  ... and {len(results) - 50} more.")
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    if len(results) > 50:
-        print(f"  ... and {len(results) - 50} more.")
+        print(
+            "\nCommands: [numbers] select | [a]ll | [d]etails | [s]ave | [Enter] skip"
+        )
+        raw = input("→ ").strip()
 
-    print("\nCommands: [numbers] select | [a]ll | [d]etails | [s]ave | [Enter] skip")
-    raw = input("→ ").strip()
+        if raw.lower() != "d":
+            break
+        show_details = True
 
     if not raw:
         return []
@@ -971,35 +1657,23 @@ def display_results(results: List[str], show_details: bool = False) -> List[str]
         print(f"   Selected all {len(results)} results")
         return results
 
-    if raw.lower() == "d":
-        return display_results(results, show_details=True)
-
     if raw.lower() == "s":
         export_results(results)
         return []
 
     selected = set()
-    for part in raw.replace(" ", "").split(","):
-        if "-" in part:
-            try:
-                s, e = part.split("-")
-                s, e = int(s), int(e)
-                selected.update(range(s, e + 1))
-            except:
-                pass
-        else:
-            try:
-                selected.add(int(part))
-            except:
-                pass
+    for m in _SELECTION_RE.finditer(raw):
+        start = int(m[1])
+        end = int(m[2]) if m[2] else start
+        selected.update(range(max(start, 1), min(end, len(results)) + 1))
 
-    paths = [results[i - 1] for i in sorted(selected) if 1 <= i <= len(results)]
+    paths = [results[i - 1] for i in sorted(selected)]
     if paths:
-        print(f"   Selected {len(paths)} file(s)")
-        for p in paths[:10]:
-            print(f"     • {Path(p).name}")
+        lines = [f"   Selected {len(paths)} file(s)"]
+        lines.extend(f"     • {Path(p).name}" for p in paths[:10])
         if len(paths) > 10:
-            print(f"     ... and {len(paths) - 10} more")
+            lines.append(f"     ... and {len(paths) - 10} more")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     return paths
 
@@ -1024,37 +1698,35 @@ def export_results(results: List[str]):
 
         elif choice == "2":
             filename = f"search_results_{timestamp}.csv"
+            rows = []
+            for path, st in zip(results, stat_all(results)):
+                try:
+                    if st is not None:
+                        mtime = datetime.fromtimestamp(st.st_mtime).strftime(
+                            "%Y-%m-%d %H:%M:%S"
+                        )
+                        rows.append([path, st.st_size, mtime, get_file_icon(path)])
+                except (OSError, OverflowError, ValueError):
+                    rows.append([path, "", "", ""])
+            # csv.writer quotes paths that contain commas or quotes
             with open(filename, "w", encoding="utf-8", newline="") as f:
-                f.write("Path,Size,Modified,Type\n")
-                for path in results:
-                    try:
-                        p = Path(path)
-                        if p.exists():
-                            stat = p.stat()
-                            size = stat.st_size
-                            mtime = datetime.fromtimestamp(stat.st_mtime).strftime(
-                                "%Y-%m-%d %H:%M:%S"
-                            )
-                            ftype = get_file_icon(path)
-                            f.write(f'"{path}",{size},"{mtime}","{ftype}"\n')
-                    except:
-                        f.write(f'"{path}",,,\n')
+                writer = csv.writer(f)
+                writer.writerow(["Path", "Size", "Modified", "Type"])
+                writer.writerows(rows)
             print(f"✓ Exported to {filename}")
 
         elif choice == "3":
             filename = f"search_results_{timestamp}.json"
             data = []
-            for path in results:
+            for path, st in zip(results, stat_all(results)):
                 try:
-                    p = Path(path)
-                    if p.exists():
-                        stat = p.stat()
+                    if st is not None:
                         data.append(
                             {
                                 "path": path,
-                                "size": stat.st_size,
+                                "size": st.st_size,
                                 "modified": datetime.fromtimestamp(
-                                    stat.st_mtime
+                                    st.st_mtime
                                 ).isoformat(),
                                 "type": get_file_icon(path),
                             }
@@ -1064,8 +1736,14 @@ def export_results(results: List[str]):
                 except:
                     data.append({"path": path, "error": True})
 
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            try:
+                import orjson
+
+                with open(filename, "wb") as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            except ImportError:
+                with open(filename, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
             print(f"✓ Exported to {filename}")
 
     except Exception as e:
@@ -1105,11 +1783,13 @@ def preview_file(path: str):
             return
 
         print("\n" + "─" * 60)
-        with open(path, "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()[:30]  # First 30 lines
-            for line in lines:
-                print(line.rstrip())
-        if len(lines) >= 30:
+        # The first 30 lines almost always fit in the first 16KB
+        with open(path, "rb") as f:
+            data = f.read(PREVIEW_BYTES)
+        lines = data.decode("utf-8", errors="replace").splitlines()[:30]
+        for line in lines:
+            print(line.rstrip())
+        if len(lines) >= 30 or len(data) == PREVIEW_BYTES:
             print("...")
         print("─" * 60)
 
@@ -1120,6 +1800,14 @@ def preview_file(path: str):
 # ================================
 # ACTION MENU
 # ================================
+# Every prefix of each action name, mapped to its one-letter command
+_ACTION_PREFIXES = {
+    action[:i]: action[0]
+    for action in ("open", "folder", "copy", "preview", "delete", "quit")
+    for i in range(1, len(action) + 1)
+}
+
+
 def post_action_menu(paths: List[str], config: dict):
     if not paths:
         return
@@ -1142,12 +1830,8 @@ def post_action_menu(paths: List[str], config: dict):
             )
             choice = input("  → ").strip().lower()
 
-            # Fuzzy match
-            matched = fuzzy_match(
-                choice, ["open", "folder", "copy", "preview", "delete", "quit"]
-            )
-            if matched:
-                choice = matched[0]  # First letter
+            # Any prefix of an action name selects it ("pre" -> "p")
+            choice = _ACTION_PREFIXES.get(choice, choice)
 
             if choice == "q":
                 print("   ⏭ Skipped remaining files")
@@ -1160,11 +1844,11 @@ def post_action_menu(paths: List[str], config: dict):
             if choice == "o":
                 try:
                     if app:
-                        subprocess.Popen([app, path])
+                        open_detached([app, path])
                     elif IS_WINDOWS:
                         os.startfile(path)
                     else:
-                        subprocess.run(["open" if IS_MACOS else "xdg-open", path])
+                        open_detached(["open" if IS_MACOS else "xdg-open", path])
                     print("   ✓ Opened")
                     # Stay in loop for more actions
                 except Exception as e:
@@ -1176,7 +1860,7 @@ def post_action_menu(paths: List[str], config: dict):
                     if IS_WINDOWS:
                         os.startfile(folder)
                     else:
-                        subprocess.run(["open" if IS_MACOS else "xdg-open", folder])
+                        open_detached(["open" if IS_MACOS else "xdg-open", folder])
                     print("   ✓ Folder opened")
                     # Stay in loop for more actions
                 except Exception as e:
@@ -1241,7 +1925,9 @@ def parse_filters_from_args(args) -> SearchFilters:
     if args.large:
         filters.min_size = 100 * 1024 * 1024  # 100MB
     if args.recent:
-        filters.modified_after = datetime.now() - timedelta(days=args.recent)
+        filters.modified_after = (datetime.now() - timedelta(days=args.recent)).replace(
+            second=0, microsecond=0
+        )
 
     return filters
 
@@ -1250,58 +1936,109 @@ def parse_filters_from_args(args) -> SearchFilters:
 # MAIN MENU
 # ================================
 def interactive_menu(tools: Tools, config: dict) -> Tuple[str, str, Optional[str]]:
-    clear_screen()
-    print("=" * 60)
-    print("     FAST FILE & CONTENT SEARCH")
-    print(f"               v{VERSION}")
-    print("=" * 60)
-    print("  1) Filename search")
-    print("  2) Text inside files")
-    print("  3) Search history")
-    print("  4) Config settings")
-    print("  5) Exit")
-
-    choice = input("\nPick [1]: ").strip() or "1"
-
-    if choice == "3":
-        entry = show_history(config)
-        if entry:
-            return entry["mode"], entry["query"], entry.get("ext")
+    while True:
+        clear_screen()
+        print("=" * 60)
+        print("     FAST FILE & CONTENT SEARCH")
+        print(f"               v{VERSION}")
+        print("=" * 60)
+        print("  1) Filename search")
+        print("  2) Text inside files")
+        print("  3) Search history")
+        print("  4) Config settings")
+        print("  5) Exit")
+
+        choice = input("\nPick [1]: ").strip() or "1"
+
+        if choice == "3":
+            entry = show_history(config)
+            if entry:
+                return entry["mode"], entry["query"], entry.get("ext")
+
+        elif choice == "4":
+            show_config(config)
+            edit_choice = (
+                input("\n[e]dit config or [Enter] to continue: ").strip().lower()
+            )
+            if edit_choice == "e":
+                edit_config_interactive(config)
+
+        elif choice == "5":
+            clear_screen()
+            sys.exit(0)
+
+        elif choice == "2":
+            text = input("\nText to find: ").strip()
+            if not text:
+                print("Text required!")
+                time.sleep(1)
+                continue
+            ext = input("File type (e.g., py, txt) [all]: ").strip() or None
+            return "content", text, ext
+
         else:
-            return interactive_menu(tools, config)
+            query = input("\nFilename pattern: ").strip()
+            if not query:
+                print("Query required!")
+                time.sleep(1)
+                continue
+            return "filename", query, None
 
-    elif choice == "4":
-        show_config(config)
-        edit_choice = input("\n[e]dit config or [Enter] to continue: ").strip().lower()
-        if edit_choice == "e":
-            edit_config_interactive(config)
-        return interactive_menu(tools, config)
 
-    elif choice == "5":
+# ================================
+# MAIN
+# ================================
+def run_search(
+    tools: Tools,
+    config: dict,
+    filters: SearchFilters,
+    mode: str,
+    query: str,
+    ext: Optional[str],
+    clear_enabled: bool,
+):
+    """Run one search, then let the user pick and act on results"""
+    if clear_enabled:
         clear_screen()
+
+    print(f"\n{'=' * 60}")
+    print(f"Searching: {query}")
+    if ext:
+        print(f"Extension: {ext}")
+    if filters.min_size or filters.max_size:
+        print(
+            f"Size: {format_size(filters.min_size or 0)} - {format_size(filters.max_size or float('inf'))}"
+        )
+    if filters.modified_after or filters.modified_before:
+        print(
+            f"Modified: {filters.modified_after or 'any'} - {filters.modified_before or 'any'}"
+        )
+    print(f"{'=' * 60}")
+
+    # Files may have changed since the last search
+    stat_path.cache_clear()
+    results = []
+    try:
+        if mode == "filename":
+            results = smart_search_filename(query, tools, config, filters)
+        else:
+            results = smart_search_content(query, ext, tools, config, filters)
+    except KeyboardInterrupt:
+        terminate_running_cmds()
+        print("\n\n[Cancelled]")
         sys.exit(0)
+    except Exception as e:
+        logging.error(f"Search failed: {e}")
+        print(f"\n[Error] Search failed: {e}")
+        sys.exit(1)
 
-    elif choice == "2":
-        text = input("\nText to find: ").strip()
-        if not text:
-            print("Text required!")
-            time.sleep(1)
-            return interactive_menu(tools, config)
-        ext = input("File type (e.g., py, txt) [all]: ").strip() or None
-        return "content", text, ext
+    # Add to history
+    add_to_history(config, mode, query, ext, len(results))
 
-    else:
-        query = input("\nFilename pattern: ").strip()
-        if not query:
-            print("Query required!")
-            time.sleep(1)
-            return interactive_menu(tools, config)
-        return "filename", query, None
+    selected = display_results(results)
+    post_action_menu(selected, config)
 
 
-# ================================
-# MAIN
-# ================================
 def main():
     parser = argparse.ArgumentParser(
         description="Fast File & Content Search Tool",
@@ -1341,10 +2078,18 @@ def main():
     # Other
     parser.add_argument("--no-clear", action="store_true", help="Don't clear screen")
     parser.add_argument("--history", action="store_true", help="Show search history")
+    parser.add_argument(
+        "--list-drives", action="store_true", help="List searchable drives"
+    )
     parser.add_argument("--version", action="version", version=f"v{VERSION}")
 
     args = parser.parse_args()
 
+    # Fast paths that need neither config nor tools
+    if args.list_drives:
+        print("\n".join(get_drives()))
+        sys.exit(0)
+
     # Load config
     config = load_config()
 
@@ -1358,7 +2103,8 @@ def main():
             sys.exit(0)
         elif args.config == "reset":
             config.clear()
-            config.update(load_config())
+            config.update(get_default_config())
+            save_config(config)
             print("✓ Config reset to defaults")
             sys.exit(0)
 
@@ -1389,67 +2135,32 @@ def main():
         sys.exit(0)
 
     # Ensure tools are installed
-    tools = ensure_tools()
+    tools = ensure_tools(config)
     clear_enabled = not args.no_clear
 
     # Parse filters
     filters = parse_filters_from_args(args)
 
-    # Determine search mode
-    if not args.query and not args.content:
-        mode, query, ext = interactive_menu(tools, config)
-    else:
-        mode = "content" if args.content else "filename"
-        query = args.query
-        ext = args.ext
-
-    if not query:
-        print("[Error] Query required.")
-        sys.exit(1)
-
-    if clear_enabled:
-        clear_screen()
-
-    print(f"\n{'=' * 60}")
-    print(f"Searching: {query}")
-    if ext:
-        print(f"Extension: {ext}")
-    if filters.min_size or filters.max_size:
-        print(
-            f"Size: {format_size(filters.min_size or 0)} - {format_size(filters.max_size or float('inf'))}"
-        )
-    if filters.modified_after or filters.modified_before:
-        print(
-            f"Modified: {filters.modified_after or 'any'} - {filters.modified_before or 'any'}"
-        )
-    print(f"{'=' * 60}")
+    # The command-line query runs first; "search again" goes to the menu
+    pending = None
+    if args.query or args.content:
+        pending = ("content" if args.content else "filename", args.query, args.ext)
 
-    results = []
-    try:
-        if mode == "filename":
-            results = smart_search_filename(query, tools, config, filters)
-        else:
-            results = smart_search_content(query, ext, tools, config, filters)
-    except KeyboardInterrupt:
-        print("\n\n[Cancelled]")
-        sys.exit(0)
-    except Exception as e:
-        logging.error(f"Search failed: {e}")
-        print(f"\n[Error] Search failed: {e}")
-        sys.exit(1)
+    while True:
+        mode, query, ext = pending or interactive_menu(tools, config)
+        pending = None
 
-    # Add to history
-    add_to_history(config, mode, query, ext, len(results))
+        if not query:
+            print("[Error] Query required.")
+            sys.exit(1)
 
-    selected = display_results(results)
-    post_action_menu(selected, config)
+        run_search(tools, config, filters, mode, query, ext, clear_enabled)
 
-    print("\n" + "=" * 60)
-    another = input("Search again? [Y/n]: ").strip().lower()
-    if another not in ("n", "no"):
-        main()
-    else:
-        clear_screen()
+        print("\n" + "=" * 60)
+        another = input("Search again? [Y/n]: ").strip().lower()
+        if another in ("n", "no"):
+            clear_screen()
+            break
 
 
 if __name__ == "__main__":
@@ -8,38 +8,279 @@ import sys
 import os
 import subprocess
 import json
+import csv
+import base64
 import re
+import shutil
 import platform
+import textwrap
+import time
+import multiprocessing
+from html import escape as html_escape
+from string import Template
+from functools import lru_cache
+from itertools import islice, repeat
 from pathlib import Path
+from types import SimpleNamespace
 from typing import List, Dict, Optional, Tuple
 import threading
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+# orjson parses rg's JSON lines straight from bytes, several times faster
+try:
+    import orjson
+    from orjson import loads as json_loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+# RE2 matches in linear time, so user-typed patterns can't backtrack forever
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# tabulate renders the Markdown export table; without it a plain list is written
+try:
+    from tabulate import tabulate
+except ImportError:
+    tabulate = None
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLineEdit, QTextEdit, QLabel, QComboBox, QCheckBox,
     QSpinBox, QGroupBox, QSplitter, QFileDialog, QTabWidget, QTableWidget,
     QTableWidgetItem, QHeaderView, QStatusBar, QProgressBar, QMessageBox,
-    QListWidget, QListWidgetItem, QSizePolicy, QDateEdit, QDoubleSpinBox
+    QListView, QSizePolicy, QDateEdit, QDoubleSpinBox, QShortcut, QDialog
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSettings, QDate
-from PyQt5.QtGui import QFont, QColor, QTextCursor, QTextCharFormat, QSyntaxHighlighter
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal, QSettings, QDate, QAbstractListModel, QModelIndex
+from PyQt5.QtGui import QFont, QColor, QTextCursor, QTextCharFormat, QSyntaxHighlighter, QKeySequence
 
 # Import the backend search class - MERGED FROM advanced_search.py
-from collections import defaultdict
+from collections import defaultdict, OrderedDict, Counter, deque
 
 # Platform detection
 IS_WINDOWS = platform.system() == "Windows"
 IS_MACOS = platform.system() == "Darwin"
 IS_LINUX = platform.system() == "Linux"
 
+# Repeat-search cache: entries, max rows per entry, seconds before rerun
+SEARCH_CACHE_SIZE = 16
+SEARCH_CACHE_ROWS = 50000
+SEARCH_CACHE_TTL = 60
+
+# HTML export: rows rendered per chunk, and the size that goes multi-process
+EXPORT_CHUNK_ROWS = 5000
+EXPORT_PARALLEL_ROWS = 50000
+
+# rg --vimgrep line: path:line:column:text (non-greedy path keeps C:\ intact)
+VIMGREP_RE = re.compile(rb'^(.*?):(\d+):\d+:(.*?)\r?\n?$', re.DOTALL)
+
+# Definition regexes per language, {s} is the escaped symbol
+DEF_TEMPLATES = {
+    'python': (
+        r'^\s*def\s+{s}\s*\(',
+        r'^\s*class\s+{s}\s*[:\(]',
+        r'^{s}\s*=',
+    ),
+    'javascript': (
+        r'function\s+{s}\s*\(',
+        r'const\s+{s}\s*=',
+        r'let\s+{s}\s*=',
+        r'class\s+{s}\s*\{{',
+    ),
+    'csharp': (
+        r'(public|private|protected|internal)\s+.*\s+{s}\s*\(',
+        r'(public|private|protected|internal)\s+class\s+{s}',
+        r'(public|private|protected|internal)\s+.*\s+{s}\s*\{{',
+    ),
+    'go': (
+        r'func\s+{s}\s*\(',
+        r'type\s+{s}\s+struct',
+    ),
+}
+
+# Language combo display names -> find_definition backend names
+LANG_MAP = {
+    "Python": "python",
+    "C#": "csharp",
+    "JavaScript": "javascript",
+    "TypeScript": "typescript",
+    "Go": "go",
+    "Rust": "rust",
+    "Java": "java",
+    "C++": "cpp",
+    "C": "c",
+    "PHP": "php",
+    "Ruby": "ruby",
+    "Swift": "swift",
+    "Kotlin": "kotlin"
+}
+
+# File extension -> highlight.js language used by the HTML exports
+EXT_LANG = {
+    '.py': 'python', '.js': 'javascript', '.ts': 'typescript',
+    '.cs': 'csharp', '.java': 'java', '.cpp': 'cpp', '.cc': 'cpp', '.c': 'c',
+    '.go': 'go', '.rs': 'rust', '.php': 'php', '.rb': 'ruby',
+    '.swift': 'swift', '.kt': 'kotlin', '.html': 'html',
+    '.css': 'css', '.json': 'json', '.xml': 'xml'
+}
+
+# Search mode -> (input placeholder, input enabled)
+MODE_PLACEHOLDERS = {
+    "Basic Search": ("🔎 Enter search pattern - searches inside files (supports regex)...", True),
+    "Filename Search": ("🔎 Enter filename pattern (e.g., admin)...", True),
+    "Find Definition": ("Enter function/class name...", True),
+    "Find Usages": ("Enter symbol name...", True),
+    "Find TODOs": ("Will search for TODO and FIXME comments", False),
+    "Multiple Patterns (AND)": ("Enter patterns separated by spaces...", True),
+    "Multiple Patterns (OR)": ("Enter patterns separated by spaces...", True),
+}
+
+# Markup around the matched line in the preview pane
+PREVIEW_HL_OPEN = "<b style='background-color: #264f78;'>"
+PREVIEW_HL_CLOSE = "</b>"
+
 # Common folders to search (smart locations)
 COMMON_FOLDERS = [
     "Desktop", "Documents", "Downloads", "Pictures", 
     "Videos", "Music", "OneDrive", "Google Drive", "Dropbox"
 ]
 
+@lru_cache(maxsize=256)
+def _compiled(pattern: str, flags: int = 0):
+    """Compile a regex once and reuse it across calls"""
+    return re.compile(pattern, flags)
+
+@lru_cache(maxsize=256)
+def _line_filter(pattern: str, ignore_case: bool = False):
+    """Compiled line filter - RE2 when installed, else the stdlib engine"""
+    if re2 is not None:
+        try:
+            return re2.compile(('(?i)' if ignore_case else '') + pattern)
+        except Exception:
+            pass  # Backreferences/lookaround aren't RE2 syntax
+    return _compiled(pattern, re.IGNORECASE if ignore_case else 0)
+
+@lru_cache(maxsize=None)
+def _rg_has_pcre2(rg_path: str) -> bool:
+    """Check once whether this ripgrep build ships the PCRE2 engine"""
+    startupinfo = None
+    creationflags = 0
+    if IS_WINDOWS:
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = subprocess.SW_HIDE
+        creationflags = subprocess.CREATE_NO_WINDOW
+    try:
+        result = subprocess.run(
+            [rg_path, '--pcre2-version'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            startupinfo=startupinfo,
+            creationflags=creationflags
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
+
+def _rg_text(data: Dict) -> str:
+    """Text of an rg JSON data field - non-UTF-8 content comes base64 encoded"""
+    text = data.get('text')
+    if text is None:
+        text = base64.b64decode(data.get('bytes', '')).decode('utf-8', 'replace')
+    return text
+
+@lru_cache(maxsize=1)
+def _rg_path() -> str:
+    """Find ripgrep executable once per process, without spawning which/where"""
+    found = shutil.which('rg')
+    if found:
+        return found
+    
+    # Try common paths
+    common_paths = [
+        r"C:\Program Files\ripgrep\rg.exe",
+        r"C:\tools\ripgrep\rg.exe",
+        str(Path.home() / "scoop" / "shims" / "rg.exe"),
+    ]
+    
+    for path in common_paths:
+        if os.path.exists(path):
+            return path
+    
+    return 'rg'  # Fallback
+
+@lru_cache(maxsize=64)
+def _read_window(path: str, mtime_ns: int, start: int, end: int) -> Tuple[str, ...]:
+    """Lines [start, end) of a file - mtime in the key drops stale entries"""
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        return tuple(islice(f, start, end))
+
+@lru_cache(maxsize=256)
+def _render_preview(path: str, mtime_ns: int, line_num: int) -> str:
+    """Preview HTML for a match - source lines are escaped for setHtml"""
+    # Show context around the match
+    context_before = 5
+    context_after = 5
+    start = max(0, line_num - context_before - 1)
+    end = line_num + context_after
+    
+    # Only read up to the window - never the whole file
+    lines = _read_window(path, mtime_ns, start, end)
+    
+    # Remove only the common indentation to preserve structure but align left
+    dedented = textwrap.dedent(''.join(lines)).split('\n')[:len(lines)]
+    
+    parts = []
+    for i, line in enumerate(dedented, start):
+        adjusted_line = html_escape(line.rstrip())
+        line_prefix = f"{i + 1:4d} | "
+        
+        if i + 1 == line_num:
+            parts.append(f"{PREVIEW_HL_OPEN}{line_prefix}{adjusted_line}{PREVIEW_HL_CLOSE}<br>")
+        else:
+            parts.append(f"{line_prefix}{adjusted_line}<br>")
+    
+    return f"<pre style='font-family: Consolas; margin: 0; padding: 8px;'>{''.join(parts)}</pre>"
+
+
+def detect_language(filename: str) -> str:
+    """Map a file name to its highlight.js language"""
+    return EXT_LANG.get(os.path.splitext(filename)[1].lower(), 'plaintext')
+
+
+def _render_html_rows(results: List[Dict], search_pattern: str) -> str:
+    """Render HTML export table rows (module-level so worker processes can run it)"""
+    # Rows are matched after escaping, so the pattern is escaped the same way
+    search_pattern = html_escape(search_pattern)
+    highlight_re = _compiled(f'({re.escape(search_pattern)})', re.IGNORECASE) if search_pattern else None
+    parts = []
+    for result in results:
+        file_name = result['file']
+        line_num = result['line_num']
+        content = result['line'].strip()
+        
+        # Escape HTML
+        content_escaped = html_escape(content)
+        
+        # Highlight the search pattern (case-insensitive); a plain substring
+        # test is far cheaper than letting sub() scan lines that can't match
+        if highlight_re and search_pattern in content_escaped.lower():
+            content_escaped = highlight_re.sub(r'<span class="match-highlight">\1</span>', content_escaped)
+        
+        lang = detect_language(file_name)
+        
+        parts.append(f"""                <tr>
+                    <td class="file-cell">{file_name}</td>
+                    <td class="line-cell">{line_num}</td>
+                    <td class="content-cell"><pre><code class="language-{lang}">{content_escaped}</code></pre></td>
+                </tr>
+""")
+    return ''.join(parts)
+
+
 def get_smart_locations() -> List[Path]:
     """Get smart search locations (Desktop, Documents, etc.)"""
     locations = []
@@ -66,54 +307,64 @@ def get_smart_locations() -> List[Path]:
 class AdvancedSearch:
     """Advanced search backend using ripgrep - MERGED FROM advanced_search.py"""
     def __init__(self):
-        self.rg_path = self._find_ripgrep()
-        
-    def _find_ripgrep(self) -> str:
-        """Find ripgrep executable"""
-        import platform
-        try:
-            startupinfo = None
-            creationflags = 0
-            if platform.system() == 'Windows':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-                creationflags = subprocess.CREATE_NO_WINDOW
-            
-            result = subprocess.run(
-                ['where' if platform.system() == 'Windows' else 'which', 'rg'], 
-                capture_output=True, 
-                text=True,
-                startupinfo=startupinfo,
-                creationflags=creationflags
-            )
-            if result.returncode == 0:
-                return 'rg'
-        except:
-            pass
-        
-        # Try common paths
-        common_paths = [
-            r"C:\Program Files\ripgrep\rg.exe",
-            r"C:\tools\ripgrep\rg.exe",
-            str(Path.home() / "scoop" / "shims" / "rg.exe"),
-        ]
-        
-        for path in common_paths:
-            if os.path.exists(path):
-                return path
-        
-        return 'rg'  # Fallback
+        self.rg_path = _rg_path()
+        self._search_cache = OrderedDict()
+    
+    def clear_cache(self):
+        """Forget cached results so the next search reruns rg"""
+        self._search_cache.clear()
+        
+    def warm_up(self):
+        """Start rg once in the background so the first real search starts hot"""
+        # The PCRE2 probe pages the binary in and primes its own cache
+        threading.Thread(target=_rg_has_pcre2, args=(self.rg_path,), daemon=True).start()
     
     def search(self, pattern: str, path: str = ".", **kwargs) -> List[Dict]:
         """Main search function with intelligent options"""
+        # Option tweaks rerun the same query - serve it from memory while
+        # the root directory is unchanged (callers clear_cache() on a repeat)
+        try:
+            generation = os.stat(path).st_mtime_ns
+        except OSError:
+            generation = None
+        key = (pattern, path, tuple(sorted(
+            (k, tuple(v) if isinstance(v, list) else v) for k, v in kwargs.items()
+        )))
+        
+        cached = self._search_cache.get(key)
+        if cached and cached[0] == generation and time.monotonic() - cached[1] < SEARCH_CACHE_TTL:
+            self._search_cache.move_to_end(key)
+            return list(cached[2])
+        
+        results = list(self.iter_search(pattern, path, **kwargs))
+        if len(results) <= SEARCH_CACHE_ROWS:
+            self._search_cache[key] = (generation, time.monotonic(), results)
+            self._search_cache.move_to_end(key)
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return list(results)
+    
+    def iter_search(self, pattern: str, path: str = ".", **kwargs):
+        """Yield matches as ripgrep streams them instead of buffering stdout"""
         cmd = [self.rg_path]
         
+        # Plain file:line:col:text is far cheaper to parse than JSON when
+        # the caller doesn't need submatches (context lines need JSON)
+        structured = kwargs.get('structured', True) or any(
+            kwargs.get(k) for k in ('context', 'before', 'after')
+        )
+        
         # Core options for structured output
-        cmd.extend(['--json', '--line-number'])
+        if structured:
+            cmd.extend(['--json', '--line-number'])
+        else:
+            cmd.extend(['--vimgrep', '--no-heading', '--color=never'])
+        
+        # Extra -e patterns let rg match several regexes in one pass
+        patterns = kwargs.get('patterns') or [pattern]
         
         # Smart case sensitivity
-        if kwargs.get('smart_case', True) and pattern.islower():
+        if kwargs.get('smart_case', True) and ''.join(patterns).islower():
             cmd.append('--smart-case')
         elif kwargs.get('case_insensitive', False):
             cmd.append('--ignore-case')
@@ -141,6 +392,8 @@ class AdvancedSearch:
             cmd.append('--word-regexp')
         if kwargs.get('fixed_strings'):
             cmd.append('--fixed-strings')
+        if kwargs.get('pcre2'):
+            cmd.append('--pcre2')
         
         # Performance
         if kwargs.get('hidden'):
@@ -156,7 +409,9 @@ class AdvancedSearch:
         if kwargs.get('max_count'):
             cmd.extend(['--max-count', str(kwargs['max_count'])])
         
-        cmd.extend([pattern, path])
+        for p in patterns:
+            cmd.extend(['-e', p])
+        cmd.append(path)
         
         # Suppress CMD window on Windows
         startupinfo = None
@@ -168,45 +423,82 @@ class AdvancedSearch:
             creationflags = subprocess.CREATE_NO_WINDOW
         
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd, 
-                capture_output=True, 
-                text=True,
+                stdout=subprocess.PIPE, 
+                stderr=subprocess.DEVNULL,
+                bufsize=1 << 20,
                 startupinfo=startupinfo,
                 creationflags=creationflags
             )
-            return self._parse_json_output(result.stdout)
         except Exception as e:
             print(f"❌ Search failed: {e}")
-            return []
+            return
+        
+        try:
+            if structured:
+                yield from self._iter_json_output(proc.stdout)
+            else:
+                yield from self._iter_vimgrep_output(proc.stdout)
+        finally:
+            # Consumer may stop early - don't leave rg writing to a dead pipe
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
     
-    def _parse_json_output(self, output: str) -> List[Dict]:
-        """Parse ripgrep JSON output"""
-        results = []
+    def _iter_json_output(self, lines):
+        """Parse ripgrep JSON output one line at a time"""
         current_file = None
         
-        for line in output.strip().split('\n'):
-            if not line:
+        for line in lines:
+            try:
+                data = json_loads(line)
+            except ValueError:
                 continue
+            msg_type = data.get('type')
             
-            try:
-                data = json.loads(line)
-                msg_type = data.get('type')
-                
-                if msg_type == 'begin':
-                    current_file = data['data']['path']['text']
-                elif msg_type == 'match':
-                    match_data = data['data']
-                    results.append({
-                        'file': current_file,
-                        'line_num': match_data['line_number'],
-                        'line': match_data['lines']['text'].rstrip('\n'),
-                        'submatches': match_data.get('submatches', []),
-                    })
-            except json.JSONDecodeError:
+            if msg_type == 'begin':
+                current_file = _rg_text(data['data']['path'])
+            elif msg_type == 'match':
+                match_data = data['data']
+                # rg ends every line with exactly one newline - slice it off
+                text = _rg_text(match_data['lines'])
+                if text[-1:] == '\n':
+                    text = text[:-1]
+                yield {
+                    'file': current_file,
+                    'line_num': match_data['line_number'],
+                    'line': text,
+                    'submatches': match_data.get('submatches', []),
+                }
+    
+    def _iter_vimgrep_output(self, lines):
+        """Parse ripgrep --vimgrep output one line at a time"""
+        previous = None
+        paths = {}  # Every row of a file shares one decoded path string
+        
+        for line in lines:
+            match = VIMGREP_RE.match(line)
+            if not match:
                 continue
-        
-        return results
+            raw_file, raw_num, text = match.groups()
+            
+            # vimgrep repeats a line once per match on it - keep one row
+            if (raw_file, raw_num) == previous:
+                continue
+            previous = (raw_file, raw_num)
+            
+            file_path = paths.get(raw_file)
+            if file_path is None:
+                file_path = paths[raw_file] = raw_file.decode('utf-8', 'replace')
+            
+            yield {
+                'file': file_path,
+                'line_num': int(raw_num),
+                'line': text.decode('utf-8', 'replace'),
+                'submatches': [],
+            }
     
     def search_multiple_patterns(self, patterns: List[str], path: str = ".", 
                                   operator: str = "AND", **kwargs) -> List[Dict]:
@@ -216,63 +508,59 @@ class AdvancedSearch:
             combined = '|'.join(f'({p})' for p in patterns)
             return self.search(combined, path, **kwargs)
         else:  # AND
-            # Search for first pattern, then filter results
+            if len(patterns) > 1 and _rg_has_pcre2(self.rg_path):
+                # One rg pass: a lookahead per pattern requires all of them on the line
+                if kwargs.pop('fixed_strings', False):
+                    patterns = [re.escape(p) for p in patterns]
+                # --word-regexp would wrap the zero-width lookahead match and
+                # never hit, so the word boundaries go inside each lookahead
+                if kwargs.pop('word_boundary', False):
+                    patterns = [rf'\b(?:{p})\b' for p in patterns]
+                combined = '^' + ''.join(f'(?=.*(?:{p}))' for p in patterns)
+                return self.search(combined, path, pcre2=True, **kwargs)
+            
+            # No PCRE2 - search for first pattern, then filter results
             results = self.search(patterns[0], path, **kwargs)
             
-            import re
+            ignore_case = bool(kwargs.get('case_insensitive'))
+            if kwargs.get('fixed_strings'):
+                # Literal terms - plain substring tests, no regex engine
+                if ignore_case:
+                    terms = [p.casefold() for p in patterns[1:]]
+                    folded = ((r, r['line'].casefold()) for r in results)
+                    return [r for r, line in folded if all(t in line for t in terms)]
+                terms = patterns[1:]
+                return [r for r in results if all(t in r['line'] for t in terms)]
+            
             for pattern in patterns[1:]:
-                filtered = []
-                for result in results:
-                    if re.search(pattern, result['line'], re.IGNORECASE if kwargs.get('case_insensitive') else 0):
-                        filtered.append(result)
-                results = filtered
+                regex = _line_filter(pattern, ignore_case)
+                results = [r for r in results if regex.search(r['line'])]
             
             return results
     
     def find_definition(self, symbol: str, path: str = ".", lang: str = None) -> List[Dict]:
         """Find where a symbol is defined"""
-        patterns = {
-            'python': [
-                fr'^\s*def\s+{symbol}\s*\(',
-                fr'^\s*class\s+{symbol}\s*[:\(]',
-                fr'^{symbol}\s*=',
-            ],
-            'javascript': [
-                fr'function\s+{symbol}\s*\(',
-                fr'const\s+{symbol}\s*=',
-                fr'let\s+{symbol}\s*=',
-                fr'class\s+{symbol}\s*{{',
-            ],
-            'csharp': [
-                fr'(public|private|protected|internal)\s+.*\s+{symbol}\s*\(',
-                fr'(public|private|protected|internal)\s+class\s+{symbol}',
-                fr'(public|private|protected|internal)\s+.*\s+{symbol}\s*{{',
-            ],
-            'go': [
-                fr'func\s+{symbol}\s*\(',
-                fr'type\s+{symbol}\s+struct',
-            ],
-        }
+        s = re.escape(symbol)
         
-        if lang and lang in patterns:
-            combined = '|'.join(f'({p})' for p in patterns[lang])
+        if lang and lang in DEF_TEMPLATES:
+            templates = DEF_TEMPLATES[lang]
         else:
             # Try all patterns
-            all_patterns = []
-            for lang_patterns in patterns.values():
-                all_patterns.extend(lang_patterns)
-            combined = '|'.join(f'({p})' for p in all_patterns)
+            templates = [t for lang_templates in DEF_TEMPLATES.values() for t in lang_templates]
+        # One -e per template so rg can pull literal prefixes out of each
+        patterns = [t.format(s=s) for t in templates]
         
-        return self.search(combined, path, multiline=False)
+        return self.search(symbol, path, patterns=patterns, multiline=False)
     
     def find_usages(self, symbol: str, path: str = ".", **kwargs) -> List[Dict]:
         """Find all usages of a symbol"""
-        return self.search(rf'\b{symbol}\b', path, word_boundary=True, **kwargs)
+        kwargs.setdefault('structured', False)
+        return self.search(rf'\b{re.escape(symbol)}\b', path, word_boundary=True, **kwargs)
     
     def find_todos(self, path: str = ".", include_fixme: bool = True) -> List[Dict]:
         """Find TODO and FIXME comments"""
         pattern = r'TODO|FIXME' if include_fixme else r'TODO'
-        return self.search(pattern, path, case_insensitive=True)
+        return self.search(pattern, path, case_insensitive=True, structured=False)
 
 class SearchWorker(QThread):
     """Worker thread for running searches in background"""
@@ -298,6 +586,7 @@ class FilenameSearchWorker(QThread):
     """Worker thread for FAST filename search using ripgrep"""
     finished = pyqtSignal(list)
     error = pyqtSignal(str)
+    progress = pyqtSignal(int, int)
     
     def __init__(self, pattern, directories=None, min_size=None, max_size=None, 
                  modified_after=None, modified_before=None, use_smart_locations=True):
@@ -309,31 +598,10 @@ class FilenameSearchWorker(QThread):
         self.modified_after = modified_after
         self.modified_before = modified_before
         self.use_smart_locations = use_smart_locations
-        self.rg_path = self._find_ripgrep()
-    
-    def _find_ripgrep(self):
-        """Find ripgrep executable"""
-        try:
-            startupinfo = None
-            creationflags = 0
-            if IS_WINDOWS:
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-                creationflags = subprocess.CREATE_NO_WINDOW
-            
-            result = subprocess.run(
-                ['where' if IS_WINDOWS else 'which', 'rg'], 
-                capture_output=True, 
-                text=True,
-                startupinfo=startupinfo,
-                creationflags=creationflags
-            )
-            if result.returncode == 0:
-                return 'rg'
-        except:
-            pass
-        return 'rg'
+        self._after_ts = modified_after.timestamp() if modified_after else None
+        self._before_ts = modified_before.timestamp() if modified_before else None
+        self.has_filters = bool(min_size or max_size or modified_after or modified_before)
+        self.rg_path = _rg_path()
     
     def _apply_filters(self, filepath: str) -> bool:
         """Apply size and date filters"""
@@ -346,20 +614,52 @@ class FilenameSearchWorker(QThread):
             if self.max_size and stat.st_size > self.max_size:
                 return False
             
-            # Date filter
-            if self.modified_after:
-                mod_time = datetime.fromtimestamp(stat.st_mtime)
-                if mod_time < self.modified_after:
-                    return False
-            if self.modified_before:
-                mod_time = datetime.fromtimestamp(stat.st_mtime)
-                if mod_time > self.modified_before:
-                    return False
+            # Date filter - compare raw epoch seconds, no datetime per file
+            mtime = stat.st_mtime
+            if self._after_ts is not None and mtime < self._after_ts:
+                return False
+            if self._before_ts is not None and mtime > self._before_ts:
+                return False
             
             return True
-        except:
+        except (OSError, ValueError):
             return True  # If can't check, include it
     
+    def _list_files(self, directory: str) -> List[str]:
+        """List files under one directory matching the pattern"""
+        cmd = [self.rg_path, '--files']
+        
+        if self.pattern:
+            cmd.extend(['--iglob', f'*{self.pattern}*'])
+        
+        cmd.append(directory)
+        
+        startupinfo = None
+        creationflags = 0
+        
+        if IS_WINDOWS:
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo.wShowWindow = subprocess.SW_HIDE
+            creationflags = subprocess.CREATE_NO_WINDOW
+        
+        result = subprocess.run(
+            cmd, 
+            capture_output=True, 
+            startupinfo=startupinfo,
+            creationflags=creationflags,
+            timeout=60
+        )
+        
+        # Decode per path rather than transcoding the whole buffer; fsdecode
+        # keeps undecodable names openable
+        files = []
+        for raw in result.stdout.split(b'\n'):
+            raw = raw.strip()
+            if raw:
+                files.append(raw.decode('ascii') if raw.isascii() else os.fsdecode(raw))
+        return files
+    
     def run(self):
         try:
             self.setPriority(QThread.HighPriority)
@@ -371,51 +671,185 @@ class FilenameSearchWorker(QThread):
             if not search_dirs:
                 search_dirs = ['.']
             
-            results = []
+            # Each rg run is I/O bound, so scan all directories at once
+            listings = [None] * len(search_dirs)
+            with ThreadPoolExecutor(max_workers=min(8, len(search_dirs))) as pool:
+                futures = {pool.submit(self._list_files, d): i for i, d in enumerate(search_dirs)}
+                for done, future in enumerate(as_completed(futures), 1):
+                    listings[futures[future]] = future.result()
+                    self.progress.emit(done, len(search_dirs))
             
-            # Search each directory with ripgrep
-            for directory in search_dirs:
-                cmd = [self.rg_path, '--files']
-                
-                if self.pattern:
-                    cmd.extend(['--iglob', f'*{self.pattern}*'])
-                
-                cmd.append(directory)
+            files = [f for listing in listings for f in listing]
+            
+            # Plain listings need no stat at all
+            if self.has_filters:
+                # Stat calls block on disk too - run the filters in parallel
+                with ThreadPoolExecutor(max_workers=32) as pool:
+                    keep = list(pool.map(self._apply_filters, files))
+                files = [f for f, ok in zip(files, keep) if ok]
+            
+            results = [{
+                'file': filepath,
+                'line_num': 0,
+                'line': f"📄 {os.path.basename(filepath)}",
+                'submatches': []
+            } for filepath in files]
+            
+            self.finished.emit(results)
+        except subprocess.TimeoutExpired:
+            self.error.emit("Search timed out")
+        except Exception as e:
+            self.error.emit(str(e))
+
+class ExportWorker(QThread):
+    """Worker thread that writes an export file in the background"""
+    finished = pyqtSignal(str)
+    error = pyqtSignal(str)
+    
+    def __init__(self, file_path, results, pattern, mode, path, timestamp):
+        super().__init__()
+        self.file_path = file_path
+        self.results = results
+        self.pattern = pattern
+        self.mode = mode
+        self.path = path
+        self.timestamp = timestamp
+    
+    def _results_by_file(self):
+        """Group results by file, sorted by file name"""
+        by_file = defaultdict(list)
+        for result in self.results:
+            by_file[result['file']].append(result)
+        return sorted(by_file.items())
+    
+    def run(self):
+        file_path, results = self.file_path, self.results
+        pattern, mode, path, timestamp = self.pattern, self.mode, self.path, self.timestamp
+        total = len(results)
+        unique_files = len({r['file'] for r in results})
+        header = {
+            'pattern': pattern,
+            'mode': mode,
+            'path': path,
+            'total': total,
+            'files': unique_files,
+            'timestamp': timestamp,
+        }
+        
+        try:
+            if file_path.endswith('.html'):
+                # HTML table export - beautiful visual table with syntax highlighting (DARK THEME)
+                fields = dict(
+                    header,
+                    pattern=html_escape(pattern),
+                    mode=html_escape(mode),
+                    content_heading='📝 Content (Syntax Highlighted)',
+                )
                 
-                startupinfo = None
-                creationflags = 0
+                search_pattern = pattern.lower()
+                chunks = [results[i:i + EXPORT_CHUNK_ROWS] for i in range(0, total, EXPORT_CHUNK_ROWS)]
                 
-                if IS_WINDOWS:
-                    startupinfo = subprocess.STARTUPINFO()
-                    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                    startupinfo.wShowWindow = subprocess.SW_HIDE
-                    creationflags = subprocess.CREATE_NO_WINDOW
+                with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    f.write(EXPORT_HTML_HEAD.substitute(fields))
+                    
+                    if total > EXPORT_PARALLEL_ROWS and (os.cpu_count() or 1) > 1:
+                        # Escape + highlight is CPU-bound, so spread chunks over processes;
+                        # spawn, since forking a process that runs Qt threads is unsafe
+                        with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) as pool:
+                            f.writelines(pool.map(_render_html_rows, chunks, repeat(search_pattern)))
+                    else:
+                        f.writelines(map(_render_html_rows, chunks, repeat(search_pattern)))
+                    
+                    f.write(EXPORT_HTML_TAIL.substitute(fields))
+                    
+            elif file_path.endswith('.json'):
+                # Standard structured JSON export
+                export_data = {
+                    "search_info": {
+                        "total_matches": total,
+                        "total_files": unique_files,
+                        "export_date": timestamp,
+                        "search_pattern": pattern,
+                        "search_mode": mode,
+                        "search_path": path
+                    },
+                    "results": []
+                }
                 
-                result = subprocess.run(
-                    cmd, 
-                    capture_output=True, 
-                    text=True, 
-                    encoding='utf-8', 
-                    errors='ignore',
-                    startupinfo=startupinfo,
-                    creationflags=creationflags,
-                    timeout=60
-                )
+                # Build structured results, grouped by file for better organization
+                for file, matches in self._results_by_file():
+                    export_data["results"].append({
+                        "file": file,
+                        "match_count": len(matches),
+                        "matches": [{
+                            "line_number": m['line_num'],
+                            "content": m['line'].strip(),
+                            "match_location": f"{file}:{m['line_num']}"
+                        } for m in matches]
+                    })
                 
-                # Parse and filter results
-                for filepath in result.stdout.split('\n'):
-                    filepath = filepath.strip()
-                    if filepath and self._apply_filters(filepath):
-                        results.append({
-                            'file': filepath,
-                            'line_num': 0,
-                            'line': f"📄 {os.path.basename(filepath)}",
-                            'submatches': []
-                        })
+                if orjson is not None:
+                    # Serialized in one C call, already UTF-8 encoded
+                    with open(file_path, 'wb') as f:
+                        f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                        json.dump(export_data, f, indent=2, ensure_ascii=False)
+                    
+            elif file_path.endswith('.csv'):
+                # CSV export with proper quoting
+                with open(file_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+                    writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+                    writer.writerow(["File", "Line", "Content"])
+                    writer.writerows((r['file'], r['line_num'], r['line'].strip()) for r in results)
+                        
+            elif file_path.endswith('.md'):
+                # Markdown table export using tabulate
+                if tabulate is not None:
+                    # Prepare table data
+                    table_data = []
+                    for result in results:
+                        table_data.append([
+                            result['file'],
+                            result['line_num'],
+                            result['line'].strip()[:80]  # Truncate long lines
+                        ])
+                    
+                    # Create markdown table
+                    with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                        f.write(EXPORT_MD_HEAD.substitute(header))
+                        f.write(tabulate(table_data, headers=["File", "Line", "Content"], tablefmt="github"))
+                        
+                else:
+                    # Simple markdown without tabulate (the GUI already warned)
+                    lines = [
+                        "# Search Results\n",
+                        f"**Pattern:** `{pattern}`",
+                        f"**Total Matches:** {total}\n",
+                        "## Matches\n",
+                    ]
+                    
+                    for file, matches in self._results_by_file():
+                        lines.append(f"### {file}\n")
+                        lines.extend(f"- **Line {m['line_num']}:** `{m['line'].strip()}`" for m in matches)
+                        lines.append("")
+                    
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        f.write('\n'.join(lines) + '\n')
+                        
+            else:  # .txt
+                # Clean text export
+                with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    f.write(EXPORT_TEXT_HEAD.substitute(header))
+                    
+                    for file, matches in self._results_by_file():
+                        f.write(f"\n{file}\n{'-' * len(file)}\n")
+                        f.writelines(f"  Line {m['line_num']:4d}: {m['line'].rstrip()}\n" for m in matches)
+                        f.write("\n")
+            
+            
+            self.finished.emit(file_path)
             
-            self.finished.emit(results)
-        except subprocess.TimeoutExpired:
-            self.error.emit("Search timed out")
         except Exception as e:
             self.error.emit(str(e))
 
@@ -425,103 +859,762 @@ class ResultsHighlighter(QSyntaxHighlighter):
     def __init__(self, parent, pattern=""):
         super().__init__(parent)
         self.pattern = pattern
+        self._regex = _compiled(re.escape(pattern), re.IGNORECASE) if pattern else None
         self.highlight_format = QTextCharFormat()
         self.highlight_format.setBackground(QColor(255, 255, 0))
         self.highlight_format.setForeground(QColor(0, 0, 0))
     
     def highlightBlock(self, text):
-        if not self.pattern:
+        if not self._regex:
             return
         
-        # Simple case-insensitive highlighting
-        pattern_lower = self.pattern.lower()
-        text_lower = text.lower()
-        
-        index = text_lower.find(pattern_lower)
-        while index >= 0:
-            length = len(self.pattern)
-            self.setFormat(index, length, self.highlight_format)
-            index = text_lower.find(pattern_lower, index + length)
+        # Case-insensitive highlighting, scanned by the C regex engine
+        for match in self._regex.finditer(text):
+            self.setFormat(match.start(), match.end() - match.start(), self.highlight_format)
 
-class SearchGUI(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.searcher = AdvancedSearch()  # Use merged class instead of backend
-        self.current_worker = None
-        self.search_history = []
-        self.current_results = []
-        self.current_selected_file = None
-        self.current_selected_line = None
-        
-        # Settings
-        self.settings = QSettings('AdvancedSearch', 'SearchTool')
-        
-        self.init_ui()
-        self.load_settings()
+class ResultsModel(QAbstractListModel):
+    """List model over result dicts - Qt only asks for the rows it paints"""
     
-    def init_ui(self):
-        """Initialize the user interface"""
-        self.setWindowTitle('🔍 Advanced Code Search')
-        self.setGeometry(50, 50, 1600, 900)
-        self.setMinimumSize(1200, 700)
-        
-        # Setup keyboard shortcuts
-        self.setup_shortcuts()
-        
-        # Central widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        main_layout = QVBoxLayout(central_widget)
-        main_layout.setSpacing(10)
-        main_layout.setContentsMargins(15, 15, 15, 15)
-        
-        # Top section - Search and Options
-        top_section = QWidget()
-        top_layout = QVBoxLayout(top_section)
-        top_layout.setSpacing(8)
-        top_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Search input area
-        search_group = self.create_search_group()
-        top_layout.addWidget(search_group)
-        
-        # Options area (collapsible)
-        options_group = self.create_options_group()
-        top_layout.addWidget(options_group)
-        
-        main_layout.addWidget(top_section)
-        
-        # Splitter for results
-        splitter = QSplitter(Qt.Horizontal)
-        splitter.setHandleWidth(3)
-        splitter.setChildrenCollapsible(False)  # Prevent collapsing panels
-        
-        # Results area (left side)
-        results_widget = self.create_results_widget()
-        splitter.addWidget(results_widget)
-        
-        # Preview area (right side)
-        preview_widget = self.create_preview_widget()
-        splitter.addWidget(preview_widget)
-        
-        # Set initial sizes and prevent resizing unless user drags
-        splitter.setSizes([800, 800])
-        splitter.setStretchFactor(0, 1)
-        splitter.setStretchFactor(1, 1)
-        
-        # Store splitter reference for later
-        self.main_splitter = splitter
-        
-        main_layout.addWidget(splitter, 1)  # Stretch factor
-        
-        # Status bar
-        self.statusBar = QStatusBar()
-        self.setStatusBar(self.statusBar)
-        
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        self.progress_bar.setMaximumHeight(18)
-        self.statusBar.addPermanentWidget(self.progress_bar)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._results = []
+    
+    def set_results(self, results):
+        self.beginResetModel()
+        self._results = results
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._results)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            # Format: file.cs:123
+            result = self._results[index.row()]
+            return f"{result['file']}:{result['line_num']}"
+        if role == Qt.UserRole:
+            return self._results[index.row()]
+        return None
+    
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+def _minify_qss(qss: str) -> str:
+    """Strip comments and whitespace so Qt's stylesheet parser scans less"""
+    qss = re.sub(r'/\*.*?\*/', '', qss, flags=re.DOTALL)
+    qss = re.sub(r'\s+', ' ', qss)
+    return re.sub(r'\s*([{};:,])\s*', r'\1', qss).strip()
+
+# Modern dark theme for the main window (minified once at import)
+DARK_STYLESHEET = _minify_qss("""
+    /* Main Window */
+    QMainWindow {
+        background-color: #1e1e1e;
+    }
+    
+    /* Group Boxes */
+    QGroupBox {
+        background-color: #252526;
+        border: 2px solid #3e3e42;
+        border-radius: 8px;
+        margin-top: 12px;
+        padding-top: 16px;
+        padding: 12px;
+        font-weight: bold;
+        font-size: 13px;
+        color: #cccccc;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        left: 12px;
+        padding: 0 8px;
+        background-color: #252526;
+    }
+    #searchGroup {
+        border-color: #007acc;
+    }
+    #optionsGroup {
+        border-color: #4FC3F7;
+    }
+    
+    /* Line Edits */
+    QLineEdit {
+        background-color: #3c3c3c;
+        border: 2px solid #3e3e42;
+        border-radius: 4px;
+        padding: 8px 12px;
+        color: #cccccc;
+        font-size: 13px;
+        selection-background-color: #264f78;
+    }
+    QLineEdit:focus {
+        border: 2px solid #007acc;
+        background-color: #2d2d2d;
+    }
+    QLineEdit:hover {
+        border: 2px solid #505050;
+    }
+    #searchInput {
+        font-size: 14px;
+        padding: 10px 14px;
+    }
+    
+    /* Buttons */
+    QPushButton {
+        background-color: #0e639c;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        color: white;
+        font-weight: bold;
+        font-size: 13px;
+    }
+    QPushButton:hover {
+        background-color: #1177bb;
+    }
+    QPushButton:pressed {
+        background-color: #005a9e;
+    }
+    QPushButton:disabled {
+        background-color: #3e3e42;
+        color: #808080;
+    }
+    #searchButton {
+        background-color: #16825d;
+        font-size: 14px;
+    }
+    #searchButton:hover {
+        background-color: #1e9e6d;
+    }
+    #actionButton {
+        background-color: #3e3e42;
+        padding: 6px 12px;
+    }
+    #actionButton:hover {
+        background-color: #505050;
+    }
+    
+    /* Panel Headers */
+    #resultsHeader, #previewHeader {
+        background-color: #252525;
+        border-radius: 6px;
+        padding: 8px;
+    }
+    
+    /* Text Edits */
+    QTextEdit, QListView, QTableWidget {
+        background-color: #1e1e1e;
+        border: 1px solid #3e3e42;
+        border-radius: 4px;
+        color: #cccccc;
+        selection-background-color: #264f78;
+        font-size: 12px;
+    }
+    #previewText {
+        background-color: #1e1e1e;
+        font-family: 'Consolas', 'Courier New', monospace;
+        line-height: 1.4;
+    }
+    #statsText {
+        background-color: #252526;
+    }
+    
+    /* List Widget */
+    #resultsList {
+        background-color: #252526;
+    }
+    QListView::item {
+        padding: 8px;
+        border-bottom: 1px solid #3e3e42;
+        color: #cccccc;
+    }
+    QListView::item:hover {
+        background-color: #2a2d2e;
+    }
+    QListView::item:selected {
+        background-color: #0e639c;
+        color: white;
+        border-left: 3px solid #007acc;
+    }
+    QListView::item:selected:hover {
+        background-color: #1177bb;
+    }
+    QListView::item:alternate {
+        background-color: #2a2a2a;
+    }
+    
+    /* Table Widget */
+    #resultsTable {
+        background-color: #252526;
+        gridline-color: #3e3e42;
+    }
+    QTableWidget::item {
+        padding: 6px;
+        border: none;
+    }
+    QTableWidget::item:selected {
+        background-color: #094771;
+        color: white;
+    }
+    QTableWidget::item:alternate {
+        background-color: #2a2a2a;
+    }
+    QHeaderView::section {
+        background-color: #323233;
+        color: #cccccc;
+        padding: 8px;
+        border: none;
+        border-right: 1px solid #3e3e42;
+        border-bottom: 2px solid #007acc;
+        font-weight: bold;
+    }
+    
+    /* Combo Box */
+    QComboBox {
+        background-color: #3c3c3c;
+        border: 2px solid #3e3e42;
+        border-radius: 4px;
+        padding: 6px 12px;
+        color: #cccccc;
+        font-size: 12px;
+    }
+    QComboBox:hover {
+        border: 2px solid #505050;
+    }
+    QComboBox:focus {
+        border: 2px solid #007acc;
+    }
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 6px solid #cccccc;
+        margin-right: 6px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #252526;
+        border: 1px solid #007acc;
+        selection-background-color: #094771;
+        color: #cccccc;
+    }
+    
+    /* Check Box */
+    QCheckBox {
+        color: #cccccc;
+        spacing: 8px;
+        font-size: 12px;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border: 2px solid #3e3e42;
+        border-radius: 3px;
+        background-color: #3c3c3c;
+    }
+    QCheckBox::indicator:hover {
+        border: 2px solid #007acc;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #007acc;
+        border: 2px solid #007acc;
+    }
+    
+    /* Spin Box */
+    QSpinBox {
+        background-color: #3c3c3c;
+        border: 2px solid #3e3e42;
+        border-radius: 4px;
+        padding: 4px 8px;
+        color: #cccccc;
+        font-size: 12px;
+    }
+    QSpinBox:hover {
+        border: 2px solid #505050;
+    }
+    QSpinBox:focus {
+        border: 2px solid #007acc;
+    }
+    QSpinBox::up-button, QSpinBox::down-button {
+        background-color: #3e3e42;
+        border: none;
+        width: 18px;
+    }
+    QSpinBox::up-button:hover, QSpinBox::down-button:hover {
+        background-color: #505050;
+    }
+    
+    /* Tab Widget */
+    #resultsTabs::pane {
+        border: 1px solid #3e3e42;
+        border-radius: 4px;
+        background-color: #252526;
+    }
+    QTabBar::tab {
+        background-color: #2d2d30;
+        border: none;
+        padding: 10px 20px;
+        color: #969696;
+        font-size: 12px;
+        font-weight: bold;
+        margin-right: 2px;
+    }
+    QTabBar::tab:hover {
+        background-color: #3e3e42;
+        color: #cccccc;
+    }
+    QTabBar::tab:selected {
+        background-color: #007acc;
+        color: white;
+    }
+    
+    /* Status Bar */
+    QStatusBar {
+        background-color: #007acc;
+        color: white;
+        font-weight: bold;
+        padding: 4px;
+    }
+    
+    /* Progress Bar */
+    QProgressBar {
+        border: 1px solid #3e3e42;
+        border-radius: 3px;
+        background-color: #2d2d30;
+        text-align: center;
+        color: white;
+        font-weight: bold;
+    }
+    QProgressBar::chunk {
+        background-color: #16825d;
+        border-radius: 2px;
+    }
+    
+    /* Labels */
+    QLabel {
+        color: #cccccc;
+        font-size: 12px;
+    }
+    
+    /* Scroll Bars */
+    QScrollBar:vertical {
+        background-color: #1e1e1e;
+        width: 12px;
+        border: none;
+    }
+    QScrollBar::handle:vertical {
+        background-color: #424242;
+        border-radius: 6px;
+        min-height: 30px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background-color: #4e4e4e;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QScrollBar:horizontal {
+        background-color: #1e1e1e;
+        height: 12px;
+        border: none;
+    }
+    QScrollBar::handle:horizontal {
+        background-color: #424242;
+        border-radius: 6px;
+        min-width: 30px;
+    }
+    QScrollBar::handle:horizontal:hover {
+        background-color: #4e4e4e;
+    }
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        width: 0px;
+    }
+    
+    /* Splitter */
+    QSplitter::handle {
+        background-color: #3e3e42;
+        width: 3px;
+    }
+    QSplitter::handle:hover {
+        background-color: #007acc;
+    }
+    QSplitter::handle:pressed {
+        background-color: #1177bb;
+    }
+""")
+
+# HTML export page, split around the result rows
+EXPORT_HTML_HEAD = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Search Results - $pattern</title>
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github-dark.min.css">
+    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js"></script>
+    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/csharp.min.js"></script>
+    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/python.min.js"></script>
+    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/javascript.min.js"></script>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            background: #0d1117;
+            padding: 20px;
+            margin: 0;
+        }
+        .container {
+            max-width: 1600px;
+            margin: 0 auto;
+            background: #161b22;
+            border-radius: 10px;
+            box-shadow: 0 10px 40px rgba(0,0,0,0.5);
+            overflow: hidden;
+            border: 1px solid #30363d;
+        }
+        .header {
+            background: linear-gradient(135deg, #1f6feb 0%, #8957e5 100%);
+            color: white;
+            padding: 30px;
+            border-bottom: 2px solid #58a6ff;
+        }
+        .header h1 {
+            margin: 0 0 20px 0;
+            font-size: 32px;
+            text-shadow: 0 2px 4px rgba(0,0,0,0.3);
+        }
+        .info {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 15px;
+            margin-top: 20px;
+        }
+        .info-item {
+            background: rgba(255,255,255,0.15);
+            padding: 10px 15px;
+            border-radius: 5px;
+            backdrop-filter: blur(10px);
+        }
+        .info-label {
+            font-size: 12px;
+            opacity: 0.9;
+            margin-bottom: 5px;
+            color: #c9d1d9;
+        }
+        .info-value {
+            font-size: 18px;
+            font-weight: bold;
+            color: #ffffff;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 0;
+        }
+        thead {
+            background: #0d1117;
+            position: sticky;
+            top: 0;
+            z-index: 10;
+            border-bottom: 2px solid #58a6ff;
+        }
+        th {
+            padding: 15px;
+            text-align: left;
+            font-weight: 600;
+            color: #58a6ff;
+            border-bottom: 2px solid #30363d;
+        }
+        tbody tr {
+            border-bottom: 1px solid #21262d;
+            transition: all 0.2s;
+        }
+        tbody tr:hover {
+            background: #1c2128;
+            transform: scale(1.001);
+            box-shadow: 0 2px 8px rgba(88, 166, 255, 0.2);
+        }
+        tbody tr:nth-child(even) {
+            background: #161b22;
+        }
+        tbody tr:nth-child(even):hover {
+            background: #1c2128;
+        }
+        td {
+            padding: 12px 15px;
+            vertical-align: top;
+            color: #c9d1d9;
+        }
+        .file-cell {
+            color: #58a6ff;
+            font-weight: 500;
+            max-width: 450px;
+            word-break: break-all;
+            font-size: 13px;
+        }
+        .line-cell {
+            color: #a371f7;
+            font-weight: 700;
+            text-align: center;
+            width: 80px;
+            font-size: 14px;
+            background: #0d1117;
+            border-radius: 4px;
+        }
+        .content-cell {
+            font-family: 'Consolas', 'Courier New', monospace;
+            max-width: 700px;
+            overflow-x: auto;
+        }
+        .content-cell pre {
+            margin: 0;
+            padding: 0;
+            background: transparent !important;
+        }
+        .content-cell code {
+            padding: 8px 12px !important;
+            border-radius: 4px;
+            display: block;
+            font-size: 13px;
+            line-height: 1.5;
+            background: #0d1117 !important;
+            border: 1px solid #30363d;
+        }
+        .hljs {
+            background: #0d1117 !important;
+        }
+        .stats {
+            padding: 20px 30px;
+            background: #0d1117;
+            color: #c9d1d9;
+            text-align: center;
+            border-top: 2px solid #30363d;
+        }
+        .match-highlight {
+            background: #ffd700;
+            color: #000;
+            padding: 2px 4px;
+            border-radius: 2px;
+            font-weight: bold;
+        }
+        /* Scrollbar styling for dark theme */
+        ::-webkit-scrollbar {
+            width: 12px;
+            height: 12px;
+        }
+        ::-webkit-scrollbar-track {
+            background: #0d1117;
+        }
+        ::-webkit-scrollbar-thumb {
+            background: #30363d;
+            border-radius: 6px;
+        }
+        ::-webkit-scrollbar-thumb:hover {
+            background: #484f58;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🔍 Search Results</h1>
+            <div class="info">
+                <div class="info-item">
+                    <div class="info-label">Pattern</div>
+                    <div class="info-value">$pattern</div>
+                </div>
+                <div class="info-item">
+                    <div class="info-label">Mode</div>
+                    <div class="info-value">$mode</div>
+                </div>
+                <div class="info-item">
+                    <div class="info-label">Total Matches</div>
+                    <div class="info-value">$total</div>
+                </div>
+                <div class="info-item">
+                    <div class="info-label">Files</div>
+                    <div class="info-value">$files</div>
+                </div>
+                <div class="info-item">
+                    <div class="info-label">Export Date</div>
+                    <div class="info-value">$timestamp</div>
+                </div>
+            </div>
+        </div>
+        <table>
+            <thead>
+                <tr>
+                    <th>📁 File</th>
+                    <th>📍 Line</th>
+                    <th>$content_heading</th>
+                </tr>
+            </thead>
+            <tbody>
+""")
+
+EXPORT_HTML_TAIL = Template("""            </tbody>
+        </table>
+        <div class="stats">
+            ✨ Exported $total matches from $files files with syntax highlighting ✨
+        </div>
+    </div>
+    <script>
+        // Initialize syntax highlighting
+        hljs.highlightAll();
+        
+        // Add copy button functionality (optional)
+        document.querySelectorAll('code').forEach(block => {
+            block.style.cursor = 'pointer';
+            block.title = 'Click to copy';
+            block.addEventListener('click', function() {
+                navigator.clipboard.writeText(this.textContent);
+                const original = this.style.background;
+                this.style.background = '#4CAF50';
+                setTimeout(() => this.style.background = original, 200);
+            });
+        });
+    </script>
+</body>
+</html>""")
+
+EXPORT_HTML_TAIL_CLI = """            </tbody>
+        </table>
+        <div class="stats">
+            <p>Generated by Advanced Search Tool - CLI Mode</p>
+        </div>
+    </div>
+    <script>
+        hljs.highlightAll();
+    </script>
+</body>
+</html>"""
+
+EXPORT_MD_HEAD = Template("""# Search Results
+
+**Pattern:** `$pattern`
+**Mode:** $mode
+**Path:** `$path`
+**Total Matches:** $total
+**Files:** $files
+**Date:** $timestamp
+
+---
+
+## Results
+
+""")
+
+EXPORT_TEXT_HEAD = Template("""Search Results
+======================================================================
+
+Pattern: $pattern
+Mode: $mode
+Path: $path
+Total Matches: $total
+Files: $files
+Date: $timestamp
+
+----------------------------------------------------------------------
+
+""")
+
+class SearchGUI(QMainWindow):
+    _preview_font = None  # Shared by every window, built on first use
+    
+    def __init__(self):
+        super().__init__()
+        self.searcher = AdvancedSearch()  # Use merged class instead of backend
+        self.searcher.warm_up()
+        self.current_worker = None
+        self.export_worker = None
+        self.search_history = deque(maxlen=100)
+        self._last_search = None
+        self.current_results = []
+        self.current_selected_file = None
+        self.current_selected_line = None
+        self._stats_dirty = False
+        self._stats_counts = None
+        
+        # Preview only the last selection of a quick burst (e.g. arrow keys)
+        self._pending_preview = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(120)
+        self._preview_timer.timeout.connect(self._do_pending_preview)
+        
+        # Settings
+        self.settings = QSettings('AdvancedSearch', 'SearchTool')
+        
+        self.init_ui()
+        self.load_settings()
+    
+    def init_ui(self):
+        """Initialize the user interface"""
+        self.setWindowTitle('🔍 Advanced Code Search')
+        self.setGeometry(50, 50, 1600, 900)
+        self.setMinimumSize(1200, 700)
+        
+        # Setup keyboard shortcuts
+        self.setup_shortcuts()
+        
+        # Central widget
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget)
+        main_layout.setSpacing(10)
+        main_layout.setContentsMargins(15, 15, 15, 15)
+        
+        # Top section - Search and Options
+        top_section = QWidget()
+        top_layout = QVBoxLayout(top_section)
+        top_layout.setSpacing(8)
+        top_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Search input area
+        search_group = self.create_search_group()
+        top_layout.addWidget(search_group)
+        
+        # Options area (collapsible)
+        options_group = self.create_options_group()
+        top_layout.addWidget(options_group)
+        
+        main_layout.addWidget(top_section)
+        
+        # Splitter for results
+        splitter = QSplitter(Qt.Horizontal)
+        splitter.setHandleWidth(3)
+        splitter.setChildrenCollapsible(False)  # Prevent collapsing panels
+        
+        # Results area (left side)
+        results_widget = self.create_results_widget()
+        splitter.addWidget(results_widget)
+        
+        # Preview area (right side)
+        preview_widget = self.create_preview_widget()
+        splitter.addWidget(preview_widget)
+        
+        # Set initial sizes and prevent resizing unless user drags
+        splitter.setSizes([800, 800])
+        splitter.setStretchFactor(0, 1)
+        splitter.setStretchFactor(1, 1)
+        
+        # Store splitter reference for later
+        self.main_splitter = splitter
+        
+        main_layout.addWidget(splitter, 1)  # Stretch factor
+        
+        # Status bar
+        self.statusBar = QStatusBar()
+        self.setStatusBar(self.statusBar)
+        
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        self.progress_bar.setMaximumHeight(18)
+        self.statusBar.addPermanentWidget(self.progress_bar)
         
         # Apply modern theme
         self.apply_theme()
@@ -758,13 +1851,6 @@ class SearchGUI(QMainWindow):
         # Results header with modern design
         header_widget = QWidget()
         header_widget.setObjectName("resultsHeader")
-        header_widget.setStyleSheet("""
-            #resultsHeader {
-                background-color: #252525;
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
         header_layout = QHBoxLayout(header_widget)
         header_layout.setContentsMargins(12, 8, 12, 8)
         
@@ -796,10 +1882,20 @@ class SearchGUI(QMainWindow):
         self.results_tabs.setObjectName("resultsTabs")
         
         # List view - showing only file paths and line numbers
-        self.results_list = QListWidget()
-        self.results_list.itemClicked.connect(self.on_result_selected)
+        self.results_model = ResultsModel(self)
+        self.results_list = QListView()
+        self.results_list.setModel(self.results_model)
+        self.results_list.clicked.connect(self.on_result_selected)
+        # Arrow-key navigation previews too (debounced in on_result_selected)
+        self.results_list.selectionModel().currentChanged.connect(
+            lambda current, previous: self.on_result_selected(current))
         self.results_list.setObjectName("resultsList")
         self.results_list.setAlternatingRowColors(True)
+        # Every row is one line of text - skip per-row size hints and lay
+        # out in batches so large result sets don't stall the UI
+        self.results_list.setUniformItemSizes(True)
+        self.results_list.setLayoutMode(QListView.Batched)
+        self.results_list.setBatchSize(200)
         self.results_tabs.addTab(self.results_list, "📋 Results")
         
         # Statistics view
@@ -807,6 +1903,7 @@ class SearchGUI(QMainWindow):
         self.stats_text.setReadOnly(True)
         self.stats_text.setObjectName("statsText")
         self.results_tabs.addTab(self.stats_text, "📈 Statistics")
+        self.results_tabs.currentChanged.connect(self._on_tab_changed)
         
         layout.addWidget(self.results_tabs)
         
@@ -824,13 +1921,6 @@ class SearchGUI(QMainWindow):
         # Preview header with modern design
         header_widget = QWidget()
         header_widget.setObjectName("previewHeader")
-        header_widget.setStyleSheet("""
-            #previewHeader {
-                background-color: #252525;
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
         header_layout = QHBoxLayout(header_widget)
         header_layout.setContentsMargins(12, 8, 12, 8)
         
@@ -860,7 +1950,9 @@ class SearchGUI(QMainWindow):
         # Preview text area with code styling
         self.preview_text = QTextEdit()
         self.preview_text.setReadOnly(True)
-        self.preview_text.setFont(QFont("Consolas", 10))
+        if SearchGUI._preview_font is None:
+            SearchGUI._preview_font = QFont("Consolas", 10)
+        self.preview_text.setFont(SearchGUI._preview_font)
         self.preview_text.setObjectName("previewText")
         self.preview_text.setLineWrapMode(QTextEdit.NoWrap)
         self.preview_text.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -871,339 +1963,11 @@ class SearchGUI(QMainWindow):
     
     def apply_theme(self):
         """Apply modern dark theme with better organization"""
-        self.setStyleSheet("""
-            /* Main Window */
-            QMainWindow {
-                background-color: #1e1e1e;
-            }
-            
-            /* Group Boxes */
-            QGroupBox {
-                background-color: #252526;
-                border: 2px solid #3e3e42;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 16px;
-                padding: 12px;
-                font-weight: bold;
-                font-size: 13px;
-                color: #cccccc;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 12px;
-                padding: 0 8px;
-                background-color: #252526;
-            }
-            #searchGroup {
-                border-color: #007acc;
-            }
-            #optionsGroup {
-                border-color: #4FC3F7;
-            }
-            
-            /* Line Edits */
-            QLineEdit {
-                background-color: #3c3c3c;
-                border: 2px solid #3e3e42;
-                border-radius: 4px;
-                padding: 8px 12px;
-                color: #cccccc;
-                font-size: 13px;
-                selection-background-color: #264f78;
-            }
-            QLineEdit:focus {
-                border: 2px solid #007acc;
-                background-color: #2d2d2d;
-            }
-            QLineEdit:hover {
-                border: 2px solid #505050;
-            }
-            #searchInput {
-                font-size: 14px;
-                padding: 10px 14px;
-            }
-            
-            /* Buttons */
-            QPushButton {
-                background-color: #0e639c;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: white;
-                font-weight: bold;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #1177bb;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton:disabled {
-                background-color: #3e3e42;
-                color: #808080;
-            }
-            #searchButton {
-                background-color: #16825d;
-                font-size: 14px;
-            }
-            #searchButton:hover {
-                background-color: #1e9e6d;
-            }
-            #actionButton {
-                background-color: #3e3e42;
-                padding: 6px 12px;
-            }
-            #actionButton:hover {
-                background-color: #505050;
-            }
-            
-            /* Text Edits */
-            QTextEdit, QListWidget, QTableWidget {
-                background-color: #1e1e1e;
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-                color: #cccccc;
-                selection-background-color: #264f78;
-                font-size: 12px;
-            }
-            #previewText {
-                background-color: #1e1e1e;
-                font-family: 'Consolas', 'Courier New', monospace;
-                line-height: 1.4;
-            }
-            #statsText {
-                background-color: #252526;
-            }
-            
-            /* List Widget */
-            #resultsList {
-                background-color: #252526;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #3e3e42;
-                color: #cccccc;
-            }
-            QListWidget::item:hover {
-                background-color: #2a2d2e;
-            }
-            QListWidget::item:selected {
-                background-color: #0e639c;
-                color: white;
-                border-left: 3px solid #007acc;
-            }
-            QListWidget::item:selected:hover {
-                background-color: #1177bb;
-            }
-            QListWidget::item:alternate {
-                background-color: #2a2a2a;
-            }
-            
-            /* Table Widget */
-            #resultsTable {
-                background-color: #252526;
-                gridline-color: #3e3e42;
-            }
-            QTableWidget::item {
-                padding: 6px;
-                border: none;
-            }
-            QTableWidget::item:selected {
-                background-color: #094771;
-                color: white;
-            }
-            QTableWidget::item:alternate {
-                background-color: #2a2a2a;
-            }
-            QHeaderView::section {
-                background-color: #323233;
-                color: #cccccc;
-                padding: 8px;
-                border: none;
-                border-right: 1px solid #3e3e42;
-                border-bottom: 2px solid #007acc;
-                font-weight: bold;
-            }
-            
-            /* Combo Box */
-            QComboBox {
-                background-color: #3c3c3c;
-                border: 2px solid #3e3e42;
-                border-radius: 4px;
-                padding: 6px 12px;
-                color: #cccccc;
-                font-size: 12px;
-            }
-            QComboBox:hover {
-                border: 2px solid #505050;
-            }
-            QComboBox:focus {
-                border: 2px solid #007acc;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 6px solid #cccccc;
-                margin-right: 6px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #252526;
-                border: 1px solid #007acc;
-                selection-background-color: #094771;
-                color: #cccccc;
-            }
-            
-            /* Check Box */
-            QCheckBox {
-                color: #cccccc;
-                spacing: 8px;
-                font-size: 12px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid #3e3e42;
-                border-radius: 3px;
-                background-color: #3c3c3c;
-            }
-            QCheckBox::indicator:hover {
-                border: 2px solid #007acc;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #007acc;
-                border: 2px solid #007acc;
-            }
-            
-            /* Spin Box */
-            QSpinBox {
-                background-color: #3c3c3c;
-                border: 2px solid #3e3e42;
-                border-radius: 4px;
-                padding: 4px 8px;
-                color: #cccccc;
-                font-size: 12px;
-            }
-            QSpinBox:hover {
-                border: 2px solid #505050;
-            }
-            QSpinBox:focus {
-                border: 2px solid #007acc;
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                background-color: #3e3e42;
-                border: none;
-                width: 18px;
-            }
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background-color: #505050;
-            }
-            
-            /* Tab Widget */
-            #resultsTabs::pane {
-                border: 1px solid #3e3e42;
-                border-radius: 4px;
-                background-color: #252526;
-            }
-            QTabBar::tab {
-                background-color: #2d2d30;
-                border: none;
-                padding: 10px 20px;
-                color: #969696;
-                font-size: 12px;
-                font-weight: bold;
-                margin-right: 2px;
-            }
-            QTabBar::tab:hover {
-                background-color: #3e3e42;
-                color: #cccccc;
-            }
-            QTabBar::tab:selected {
-                background-color: #007acc;
-                color: white;
-            }
-            
-            /* Status Bar */
-            QStatusBar {
-                background-color: #007acc;
-                color: white;
-                font-weight: bold;
-                padding: 4px;
-            }
-            
-            /* Progress Bar */
-            QProgressBar {
-                border: 1px solid #3e3e42;
-                border-radius: 3px;
-                background-color: #2d2d30;
-                text-align: center;
-                color: white;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: #16825d;
-                border-radius: 2px;
-            }
-            
-            /* Labels */
-            QLabel {
-                color: #cccccc;
-                font-size: 12px;
-            }
-            
-            /* Scroll Bars */
-            QScrollBar:vertical {
-                background-color: #1e1e1e;
-                width: 12px;
-                border: none;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #424242;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #4e4e4e;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar:horizontal {
-                background-color: #1e1e1e;
-                height: 12px;
-                border: none;
-            }
-            QScrollBar::handle:horizontal {
-                background-color: #424242;
-                border-radius: 6px;
-                min-width: 30px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background-color: #4e4e4e;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-            }
-            
-            /* Splitter */
-            QSplitter::handle {
-                background-color: #3e3e42;
-                width: 3px;
-            }
-            QSplitter::handle:hover {
-                background-color: #007acc;
-            }
-            QSplitter::handle:pressed {
-                background-color: #1177bb;
-            }
-        """)
+        # Install once application-wide so Qt parses the sheet a single time,
+        # however many windows get created
+        app = QApplication.instance()
+        if app.styleSheet() != DARK_STYLESHEET:
+            app.setStyleSheet(DARK_STYLESHEET)
     
     def browse_directory(self):
         """Open directory browser"""
@@ -1213,28 +1977,16 @@ class SearchGUI(QMainWindow):
     
     def setup_shortcuts(self):
         """Setup keyboard shortcuts"""
-        from PyQt5.QtWidgets import QShortcut
-        from PyQt5.QtGui import QKeySequence
-        
-        # Ctrl+F - Focus search
-        shortcut_search = QShortcut(QKeySequence("Ctrl+F"), self)
-        shortcut_search.activated.connect(lambda: self.search_input.setFocus())
-        
-        # Ctrl+L - Focus path
-        shortcut_path = QShortcut(QKeySequence("Ctrl+L"), self)
-        shortcut_path.activated.connect(lambda: self.path_input.setFocus())
-        
-        # Ctrl+Return - Perform search
-        shortcut_exec = QShortcut(QKeySequence("Ctrl+Return"), self)
-        shortcut_exec.activated.connect(self.perform_search)
-        
-        # Ctrl+E - Export results
-        shortcut_export = QShortcut(QKeySequence("Ctrl+E"), self)
-        shortcut_export.activated.connect(self.export_results)
-        
-        # F5 - Repeat last search
-        shortcut_refresh = QShortcut(QKeySequence("F5"), self)
-        shortcut_refresh.activated.connect(self.perform_search)
+        # Widgets don't exist yet when this runs, hence the lambdas
+        shortcuts = [
+            ("Ctrl+F", lambda: self.search_input.setFocus()),  # Focus search
+            ("Ctrl+L", lambda: self.path_input.setFocus()),    # Focus path
+            ("Ctrl+Return", self.perform_search),              # Perform search
+            ("Ctrl+E", self.export_results),                   # Export results
+            ("F5", self.perform_search),                       # Repeat last search
+        ]
+        for keys, slot in shortcuts:
+            QShortcut(QKeySequence(keys), self).activated.connect(slot)
     
     def on_mode_changed(self, index):
         """Handle search mode change"""
@@ -1244,24 +1996,9 @@ class SearchGUI(QMainWindow):
         self.language_combo.setEnabled("Definition" in mode)
         
         # Update placeholder based on mode
-        if "Filename Search" in mode:
-            self.search_input.setPlaceholderText("🔎 Enter filename pattern (e.g., admin)...")
-            self.search_input.setEnabled(True)
-        elif "Multiple Patterns" in mode:
-            self.search_input.setPlaceholderText("Enter patterns separated by spaces...")
-            self.search_input.setEnabled(True)
-        elif "Definition" in mode:
-            self.search_input.setPlaceholderText("Enter function/class name...")
-            self.search_input.setEnabled(True)
-        elif "Usages" in mode:
-            self.search_input.setPlaceholderText("Enter symbol name...")
-            self.search_input.setEnabled(True)
-        elif "TODOs" in mode:
-            self.search_input.setPlaceholderText("Will search for TODO and FIXME comments")
-            self.search_input.setEnabled(False)
-        else:  # Basic Search
-            self.search_input.setPlaceholderText("🔎 Enter search pattern - searches inside files (supports regex)...")
-            self.search_input.setEnabled(True)
+        text, enabled = MODE_PLACEHOLDERS.get(mode, MODE_PLACEHOLDERS["Basic Search"])
+        self.search_input.setPlaceholderText(text)
+        self.search_input.setEnabled(enabled)
     
     def perform_search(self):
         """Execute search based on current settings"""
@@ -1326,14 +2063,10 @@ class SearchGUI(QMainWindow):
             
             self.current_worker.finished.connect(self.on_search_finished)
             self.current_worker.error.connect(self.on_search_error)
+            self.current_worker.progress.connect(self.on_search_progress)
             self.current_worker.start()
             
-            # Add to history
-            self.search_history.append({
-                'pattern': pattern,
-                'mode': mode,
-                'path': path
-            })
+            self._record_history(pattern, mode, path)
             return
         elif "Definition" in mode:
             lang = self.language_combo.currentText()
@@ -1341,22 +2074,7 @@ class SearchGUI(QMainWindow):
                 lang = None
             else:
                 # Map display names to backend names
-                lang_map = {
-                    "Python": "python",
-                    "C#": "csharp",
-                    "JavaScript": "javascript",
-                    "TypeScript": "typescript",
-                    "Go": "go",
-                    "Rust": "rust",
-                    "Java": "java",
-                    "C++": "cpp",
-                    "C": "c",
-                    "PHP": "php",
-                    "Ruby": "ruby",
-                    "Swift": "swift",
-                    "Kotlin": "kotlin"
-                }
-                lang = lang_map.get(lang, lang.lower())
+                lang = LANG_MAP.get(lang, lang.lower())
             search_func = self.searcher.find_definition
             args = (pattern, path, lang)
         elif "Usages" in mode:
@@ -1377,19 +2095,34 @@ class SearchGUI(QMainWindow):
             search_func = self.searcher.search
             args = (pattern, path)
         
+        # Repeating the exact search (F5, Enter again) must see edited files;
+        # only a switch back to earlier options is served from the cache
+        search_key = (mode, args, kwargs)
+        if search_key == self._last_search:
+            self.searcher.clear_cache()
+        self._last_search = search_key
+        
         # Create worker thread
         self.current_worker = SearchWorker(self.searcher, search_func, *args, **kwargs)
         self.current_worker.finished.connect(self.on_search_finished)
         self.current_worker.error.connect(self.on_search_error)
         self.current_worker.start()
         
-        # Add to history
+        self._record_history(pattern, mode, path)
+    
+    def _record_history(self, pattern, mode, path):
+        """Add a search to the (bounded) history"""
         self.search_history.append({
             'pattern': pattern,
             'mode': mode,
             'path': path
         })
     
+    def on_search_progress(self, done, total):
+        """Switch the progress bar to determinate once locations report back"""
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+    
     def on_search_finished(self, results):
         """Handle search completion"""
         self.current_results = results
@@ -1398,11 +2131,14 @@ class SearchGUI(QMainWindow):
         self.progress_bar.setVisible(False)
         self.search_button.setEnabled(True)
         
+        # One pass over the results feeds both the status line and statistics
+        file_counts = Counter(r['file'] for r in results)
+        
         # Display results
-        self.display_results(results)
+        self.display_results(results, file_counts)
         
         # Update status
-        file_count = len(set(r['file'] for r in results))
+        file_count = len(file_counts)
         self.statusBar.showMessage(f"Found {len(results)} matches in {file_count} files")
         self.results_label.setText(f"Results: {len(results)} matches in {file_count} files")
     
@@ -1413,560 +2149,150 @@ class SearchGUI(QMainWindow):
         self.statusBar.showMessage("Search failed")
         QMessageBox.critical(self, "Search Error", f"Search failed:\n{error_msg}")
     
-    def display_results(self, results):
+    def display_results(self, results, file_counts=None):
         """Display search results"""
-        # List view - only show file:line format
-        self.results_list.clear()
-        for result in results[:1000]:  # Limit to 1000 for performance
-            # Format: file.cs:123
-            item_text = f"{result['file']}:{result['line_num']}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, result)
-            # Ensure item is selectable
-            item.setFlags(item.flags() | Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-            self.results_list.addItem(item)
-        
-        if len(results) > 1000:
-            overflow_item = QListWidgetItem(f"... and {len(results) - 1000} more results")
-            overflow_item.setFlags(overflow_item.flags() & ~Qt.ItemIsSelectable)  # Make it non-selectable
-            self.results_list.addItem(overflow_item)
-        
-        # Statistics
-        self.display_statistics(results)
-    
-    def display_statistics(self, results):
-        """Display search statistics"""
-        if not results:
-            self.stats_text.setText("No results to analyze.")
-            return
-        
-        from collections import defaultdict
-        file_counts = defaultdict(int)
-        for result in results:
-            file_counts[result['file']] += 1
-        
-        stats_html = f"""
-        <h2>📊 Search Statistics</h2>
-        <p><b>Total Matches:</b> {len(results)}</p>
-        <p><b>Files with Matches:</b> {len(file_counts)}</p>
-        
-        <h3>Top Files:</h3>
-        <table border="1" cellpadding="5" style="border-collapse: collapse;">
-        <tr><th>Count</th><th>File</th></tr>
-        """
-        
-        for file, count in sorted(file_counts.items(), key=lambda x: x[1], reverse=True)[:20]:
-            stats_html += f"<tr><td>{count}</td><td>{file}</td></tr>"
-        
-        stats_html += "</table>"
-        
-        self.stats_text.setHtml(stats_html)
-    
-    def on_result_selected(self, item):
-        """Handle result selection from list"""
-        result = item.data(Qt.UserRole)
-        if result:
-            self.show_preview(result)
-            self.current_selected_file = result['file']
-            self.current_selected_line = result['line_num']
-
-    def show_preview(self, result):
-        """Show file preview with context"""
-        file_path = result['file']
-        line_num = result['line_num']
-        
-        self.preview_label.setText(f"👁️ Preview: {file_path}:{line_num}")
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-            
-            # Show context around the match
-            context_before = 5
-            context_after = 5
-            start = max(0, line_num - context_before - 1)
-            end = min(len(lines), line_num + context_after)
-            
-            # Find minimum indentation to preserve structure but align left
-            min_indent = float('inf')
-            for i in range(start, end):
-                line = lines[i].rstrip()
-                if line.strip():  # Only consider non-empty lines
-                    indent = len(line) - len(line.lstrip())
-                    min_indent = min(min_indent, indent)
-            
-            if min_indent == float('inf'):
-                min_indent = 0
-            
-            preview_text = ""
-            for i in range(start, end):
-                line = lines[i].rstrip()
-                # Remove only the common minimum indentation
-                if len(line) > min_indent:
-                    adjusted_line = line[min_indent:]
-                else:
-                    adjusted_line = line.lstrip()
-                    
-                line_prefix = f"{i + 1:4d} | "
-                
-                if i + 1 == line_num:
-                    preview_text += f"<b style='background-color: #264f78;'>{line_prefix}{adjusted_line}</b><br>"
-                else:
-                    preview_text += f"{line_prefix}{adjusted_line}<br>"
-            
-            self.preview_text.setHtml(f"<pre style='font-family: Consolas; margin: 0; padding: 8px;'>{preview_text}</pre>")
-            
-        except Exception as e:
-            self.preview_text.setPlainText(f"Error loading preview: {e}")
-    
-    def clear_results(self):
-        """Clear all results"""
-        self.results_list.clear()
-        self.stats_text.clear()
-        self.preview_text.clear()
-        self.current_results = []
-        self.current_selected_file = None
-        self.current_selected_line = None
-        self.results_label.setText("📊 Results: 0 matches")
-        self.preview_label.setText("👁️ Preview")
+        # List view - only show file:line format; the view is virtualized,
+        # so every result can go in
+        self.results_model.set_results(results)
+        
+        # Statistics are built when their tab is shown, not per search
+        self._stats_counts = file_counts
+        self._stats_dirty = True
+        if self.results_tabs.currentWidget() is self.stats_text:
+            self._on_tab_changed()
     
+    def _on_tab_changed(self, index=None):
+        """Build the statistics tab on demand once it is visible"""
+        if self._stats_dirty and self.results_tabs.currentWidget() is self.stats_text:
+            self._stats_dirty = False
+            self.display_statistics(self.current_results, self._stats_counts)
     
-    def export_results(self):
-        """Export results to file with better formatting"""
-        if not self.current_results:
-            QMessageBox.information(self, "No Results", "No results to export!")
+    def display_statistics(self, results, file_counts=None):
+        """Display search statistics"""
+        if not results:
+            self.stats_text.setText("No results to analyze.")
             return
         
-        file_path, selected_filter = QFileDialog.getSaveFileName(
-            self, "Export Results", "", 
-            "HTML Table (*.html);;JSON Files (*.json);;CSV Files (*.csv);;Text Files (*.txt);;Markdown Table (*.md)"
-        )
+        if file_counts is None:
+            file_counts = Counter(r['file'] for r in results)
         
-        if not file_path:
-            return
+        stats_html = f"""
+        <h2>📊 Search Statistics</h2>
+        <p><b>Total Matches:</b> {len(results)}</p>
+        <p><b>Files with Matches:</b> {len(file_counts)}</p>
         
-        try:
-            if file_path.endswith('.html'):
-                # HTML table export - beautiful visual table with syntax highlighting (DARK THEME)
-                html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Search Results - {self.search_input.text()}</title>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github-dark.min.css">
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/csharp.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/python.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/javascript.min.js"></script>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: #0d1117;
-            padding: 20px;
-            margin: 0;
-        }}
-        .container {{
-            max-width: 1600px;
-            margin: 0 auto;
-            background: #161b22;
-            border-radius: 10px;
-            box-shadow: 0 10px 40px rgba(0,0,0,0.5);
-            overflow: hidden;
-            border: 1px solid #30363d;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #1f6feb 0%, #8957e5 100%);
-            color: white;
-            padding: 30px;
-            border-bottom: 2px solid #58a6ff;
-        }}
-        .header h1 {{
-            margin: 0 0 20px 0;
-            font-size: 32px;
-            text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-        }}
-        .info {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-top: 20px;
-        }}
-        .info-item {{
-            background: rgba(255,255,255,0.15);
-            padding: 10px 15px;
-            border-radius: 5px;
-            backdrop-filter: blur(10px);
-        }}
-        .info-label {{
-            font-size: 12px;
-            opacity: 0.9;
-            margin-bottom: 5px;
-            color: #c9d1d9;
-        }}
-        .info-value {{
-            font-size: 18px;
-            font-weight: bold;
-            color: #ffffff;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 0;
-        }}
-        thead {{
-            background: #0d1117;
-            position: sticky;
-            top: 0;
-            z-index: 10;
-            border-bottom: 2px solid #58a6ff;
-        }}
-        th {{
-            padding: 15px;
-            text-align: left;
-            font-weight: 600;
-            color: #58a6ff;
-            border-bottom: 2px solid #30363d;
-        }}
-        tbody tr {{
-            border-bottom: 1px solid #21262d;
-            transition: all 0.2s;
-        }}
-        tbody tr:hover {{
-            background: #1c2128;
-            transform: scale(1.001);
-            box-shadow: 0 2px 8px rgba(88, 166, 255, 0.2);
-        }}
-        tbody tr:nth-child(even) {{
-            background: #161b22;
-        }}
-        tbody tr:nth-child(even):hover {{
-            background: #1c2128;
-        }}
-        td {{
-            padding: 12px 15px;
-            vertical-align: top;
-            color: #c9d1d9;
-        }}
-        .file-cell {{
-            color: #58a6ff;
-            font-weight: 500;
-            max-width: 450px;
-            word-break: break-all;
-            font-size: 13px;
-        }}
-        .line-cell {{
-            color: #a371f7;
-            font-weight: 700;
-            text-align: center;
-            width: 80px;
-            font-size: 14px;
-            background: #0d1117;
-            border-radius: 4px;
-        }}
-        .content-cell {{
-            font-family: 'Consolas', 'Courier New', monospace;
-            max-width: 700px;
-            overflow-x: auto;
-        }}
-        .content-cell pre {{
-            margin: 0;
-            padding: 0;
-            background: transparent !important;
-        }}
-        .content-cell code {{
-            padding: 8px 12px !important;
-            border-radius: 4px;
-            display: block;
-            font-size: 13px;
-            line-height: 1.5;
-            background: #0d1117 !important;
-            border: 1px solid #30363d;
-        }}
-        .hljs {{
-            background: #0d1117 !important;
-        }}
-        .stats {{
-            padding: 20px 30px;
-            background: #0d1117;
-            color: #c9d1d9;
-            text-align: center;
-            border-top: 2px solid #30363d;
-        }}
-        .match-highlight {{
-            background: #ffd700;
-            color: #000;
-            padding: 2px 4px;
-            border-radius: 2px;
-            font-weight: bold;
-        }}
-        /* Scrollbar styling for dark theme */
-        ::-webkit-scrollbar {{
-            width: 12px;
-            height: 12px;
-        }}
-        ::-webkit-scrollbar-track {{
-            background: #0d1117;
-        }}
-        ::-webkit-scrollbar-thumb {{
-            background: #30363d;
-            border-radius: 6px;
-        }}
-        ::-webkit-scrollbar-thumb:hover {{
-            background: #484f58;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🔍 Search Results</h1>
-            <div class="info">
-                <div class="info-item">
-                    <div class="info-label">Pattern</div>
-                    <div class="info-value">{self.search_input.text()}</div>
-                </div>
-                <div class="info-item">
-                    <div class="info-label">Mode</div>
-                    <div class="info-value">{self.search_mode.currentText()}</div>
-                </div>
-                <div class="info-item">
-                    <div class="info-label">Total Matches</div>
-                    <div class="info-value">{len(self.current_results)}</div>
-                </div>
-                <div class="info-item">
-                    <div class="info-label">Files</div>
-                    <div class="info-value">{len(set(r['file'] for r in self.current_results))}</div>
-                </div>
-                <div class="info-item">
-                    <div class="info-label">Export Date</div>
-                    <div class="info-value">{self._get_timestamp()}</div>
-                </div>
-            </div>
-        </div>
-        <table>
-            <thead>
-                <tr>
-                    <th>📁 File</th>
-                    <th>📍 Line</th>
-                    <th>📝 Content (Syntax Highlighted)</th>
-                </tr>
-            </thead>
-            <tbody>
-"""
-                # Detect language from file extension
-                def get_language(filename):
-                    if filename.endswith('.cs'):
-                        return 'csharp'
-                    elif filename.endswith('.py'):
-                        return 'python'
-                    elif filename.endswith('.js'):
-                        return 'javascript'
-                    elif filename.endswith('.ts'):
-                        return 'typescript'
-                    elif filename.endswith('.java'):
-                        return 'java'
-                    elif filename.endswith('.cpp') or filename.endswith('.cc'):
-                        return 'cpp'
-                    elif filename.endswith('.go'):
-                        return 'go'
-                    elif filename.endswith('.rs'):
-                        return 'rust'
-                    elif filename.endswith('.php'):
-                        return 'php'
-                    elif filename.endswith('.rb'):
-                        return 'ruby'
-                    return 'plaintext'
-                
-                search_pattern = self.search_input.text().lower()
-                
-                for result in self.current_results:
-                    file_name = result['file']
-                    line_num = result['line_num']
-                    content = result['line'].strip()
-                    
-                    # Escape HTML
-                    content_escaped = content.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
-                    
-                    # Highlight the search pattern
-                    if search_pattern:
-                        import re
-                        # Case-insensitive highlight
-                        pattern = re.escape(search_pattern)
-                        content_escaped = re.sub(f'({pattern})', r'<span class="match-highlight">\1</span>', 
-                                                content_escaped, flags=re.IGNORECASE)
-                    
-                    lang = get_language(file_name)
-                    
-                    html += f"""                <tr>
-                    <td class="file-cell">{file_name}</td>
-                    <td class="line-cell">{line_num}</td>
-                    <td class="content-cell"><pre><code class="language-{lang}">{content_escaped}</code></pre></td>
-                </tr>
-"""
-                
-                html += f"""            </tbody>
-        </table>
-        <div class="stats">
-            ✨ Exported {len(self.current_results)} matches from {len(set(r['file'] for r in self.current_results))} files with syntax highlighting ✨
-        </div>
-    </div>
-    <script>
-        // Initialize syntax highlighting
-        hljs.highlightAll();
+        <h3>Top Files:</h3>
+        <table border="1" cellpadding="5" style="border-collapse: collapse;">
+        <tr><th>Count</th><th>File</th></tr>
+        """
         
-        // Add copy button functionality (optional)
-        document.querySelectorAll('code').forEach(block => {{
-            block.style.cursor = 'pointer';
-            block.title = 'Click to copy';
-            block.addEventListener('click', function() {{
-                navigator.clipboard.writeText(this.textContent);
-                const original = this.style.background;
-                this.style.background = '#4CAF50';
-                setTimeout(() => this.style.background = original, 200);
-            }});
-        }});
-    </script>
-</body>
-</html>"""
-                
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(html)
-                    
-            elif file_path.endswith('.json'):
-                # Standard structured JSON export
-                export_data = {
-                    "search_info": {
-                        "total_matches": len(self.current_results),
-                        "total_files": len(set(r['file'] for r in self.current_results)),
-                        "export_date": self._get_timestamp(),
-                        "search_pattern": self.search_input.text(),
-                        "search_mode": self.search_mode.currentText(),
-                        "search_path": self.path_input.text()
-                    },
-                    "results": []
-                }
-                
-                # Group by file for better organization
-                from collections import defaultdict
-                by_file = defaultdict(list)
-                for result in self.current_results:
-                    by_file[result['file']].append({
-                        "line_number": result['line_num'],
-                        "content": result['line'].strip(),
-                        "match_location": f"{result['file']}:{result['line_num']}"
-                    })
-                
-                # Build structured results
-                for file, matches in sorted(by_file.items()):
-                    export_data["results"].append({
-                        "file": file,
-                        "match_count": len(matches),
-                        "matches": matches
-                    })
-                
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
-                    
-            elif file_path.endswith('.csv'):
-                # CSV export with proper quoting
-                with open(file_path, 'w', encoding='utf-8', newline='') as f:
-                    import csv
-                    writer = csv.writer(f, quoting=csv.QUOTE_ALL)
-                    writer.writerow(["File", "Line", "Content"])
-                    for result in self.current_results:
-                        writer.writerow([result['file'], result['line_num'], result['line'].strip()])
-                        
-            elif file_path.endswith('.md'):
-                # Markdown table export using tabulate
-                try:
-                    from tabulate import tabulate
-                    
-                    # Prepare table data
-                    table_data = []
-                    for result in self.current_results:
-                        table_data.append([
-                            result['file'],
-                            result['line_num'],
-                            result['line'].strip()[:80]  # Truncate long lines
-                        ])
-                    
-                    # Create markdown table
-                    markdown = f"# Search Results\n\n"
-                    markdown += f"**Pattern:** `{self.search_input.text()}`\n"
-                    markdown += f"**Mode:** {self.search_mode.currentText()}\n"
-                    markdown += f"**Path:** `{self.path_input.text()}`\n"
-                    markdown += f"**Total Matches:** {len(self.current_results)}\n"
-                    markdown += f"**Files:** {len(set(r['file'] for r in self.current_results))}\n"
-                    markdown += f"**Date:** {self._get_timestamp()}\n\n"
-                    markdown += "---\n\n"
-                    markdown += "## Results\n\n"
-                    markdown += tabulate(table_data, headers=["File", "Line", "Content"], tablefmt="github")
-                    
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(markdown)
-                        
-                except ImportError:
-                    # Fallback if tabulate not installed
-                    QMessageBox.warning(
-                        self, "Missing Module", 
-                        "Markdown export requires 'tabulate' module.\n"
-                        "Install with: pip install tabulate\n\n"
-                        "Falling back to simple markdown format..."
-                    )
-                    
-                    # Simple markdown without tabulate
-                    markdown = f"# Search Results\n\n"
-                    markdown += f"**Pattern:** `{self.search_input.text()}`\n"
-                    markdown += f"**Total Matches:** {len(self.current_results)}\n\n"
-                    markdown += "## Matches\n\n"
-                    
-                    from collections import defaultdict
-                    by_file = defaultdict(list)
-                    for result in self.current_results:
-                        by_file[result['file']].append(result)
-                    
-                    for file, matches in sorted(by_file.items()):
-                        markdown += f"### {file}\n\n"
-                        for match in matches:
-                            markdown += f"- **Line {match['line_num']}:** `{match['line'].strip()}`\n"
-                        markdown += "\n"
-                    
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(markdown)
-                        
-            else:  # .txt
-                # Clean text export
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(f"Search Results\n")
-                    f.write(f"{'=' * 70}\n\n")
-                    f.write(f"Pattern: {self.search_input.text()}\n")
-                    f.write(f"Mode: {self.search_mode.currentText()}\n")
-                    f.write(f"Path: {self.path_input.text()}\n")
-                    f.write(f"Total Matches: {len(self.current_results)}\n")
-                    f.write(f"Files: {len(set(r['file'] for r in self.current_results))}\n")
-                    f.write(f"Date: {self._get_timestamp()}\n")
-                    f.write(f"\n{'-' * 70}\n\n")
-                    
-                    from collections import defaultdict
-                    by_file = defaultdict(list)
-                    for result in self.current_results:
-                        by_file[result['file']].append(result)
-                    
-                    for file, matches in sorted(by_file.items()):
-                        f.write(f"\n{file}\n")
-                        f.write(f"{'-' * len(file)}\n")
-                        for match in matches:
-                            f.write(f"  Line {match['line_num']:4d}: {match['line'].rstrip()}\n")
-                        f.write("\n")
-            
-            QMessageBox.information(self, "Success", f"Results exported to:\n{file_path}")
+        rows_html = "".join(
+            f"<tr><td>{count}</td><td>{html_escape(file)}</td></tr>"
+            for file, count in file_counts.most_common(20)
+        )
+        
+        self.stats_text.setHtml(f"{stats_html}{rows_html}</table>")
+    
+    def on_result_selected(self, index):
+        """Handle result selection from list"""
+        result = index.data(Qt.UserRole)
+        if result:
+            self._pending_preview = result
+            self._preview_timer.start()
+            self.current_selected_file = result['file']
+            self.current_selected_line = result['line_num']
+    
+    def _do_pending_preview(self):
+        """Render the preview for the latest selection once input settles"""
+        if self._pending_preview:
+            self.show_preview(self._pending_preview)
+
+    def show_preview(self, result):
+        """Show file preview with context"""
+        file_path = result['file']
+        line_num = result['line_num']
+        
+        self.preview_label.setText(f"👁️ Preview: {file_path}:{line_num}")
+        
+        try:
+            # Rendered once per (file version, line) - re-clicks skip the work
+            html = _render_preview(file_path, os.stat(file_path).st_mtime_ns, line_num)
+            self.preview_text.setHtml(html)
             
         except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export:\n{e}")
+            self.preview_text.setPlainText(f"Error loading preview: {e}")
+    
+    def clear_results(self):
+        """Clear all results"""
+        self._preview_timer.stop()
+        self._pending_preview = None
+        self.results_model.set_results([])
+        self.stats_text.clear()
+        self._stats_dirty = False
+        self._stats_counts = None
+        self.preview_text.clear()
+        self.current_results = []
+        self.current_selected_file = None
+        self.current_selected_line = None
+        self.results_label.setText("📊 Results: 0 matches")
+        self.preview_label.setText("👁️ Preview")
+    
+    
+    def export_results(self):
+        """Export results to file with better formatting"""
+        if not self.current_results:
+            QMessageBox.information(self, "No Results", "No results to export!")
+            return
+        
+        if self.export_worker and self.export_worker.isRunning():
+            QMessageBox.warning(self, "Export Running", "An export is already in progress!")
+            return
+        
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Export Results", "", 
+            "HTML Table (*.html);;JSON Files (*.json);;CSV Files (*.csv);;Text Files (*.txt);;Markdown Table (*.md)"
+        )
+        
+        if not file_path:
+            return
+        
+        if file_path.endswith('.md') and tabulate is None:
+            # Fallback if tabulate not installed
+            QMessageBox.warning(
+                self, "Missing Module", 
+                "Markdown export requires 'tabulate' module.\n"
+                "Install with: pip install tabulate\n\n"
+                "Falling back to simple markdown format..."
+            )
+        
+        # Widgets are read here; the worker only sees plain values
+        self.export_worker = ExportWorker(
+            file_path, self.current_results,
+            self.search_input.text(), self.search_mode.currentText(),
+            self.path_input.text(), self._get_timestamp()
+        )
+        self.export_worker.finished.connect(self.on_export_finished)
+        self.export_worker.error.connect(self.on_export_error)
+        
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)  # Indeterminate
+        self.statusBar.showMessage("Exporting...")
+        self.export_worker.start()
+    
+    def on_export_finished(self, file_path):
+        """Handle export completion"""
+        self.progress_bar.setVisible(False)
+        self.statusBar.showMessage(f"Exported to {file_path}", 3000)
+        QMessageBox.information(self, "Success", f"Results exported to:\n{file_path}")
+    
+    def on_export_error(self, error_msg):
+        """Handle export error"""
+        self.progress_bar.setVisible(False)
+        self.statusBar.showMessage("Export failed")
+        QMessageBox.critical(self, "Export Error", f"Failed to export:\n{error_msg}")
     
     def _get_timestamp(self):
         """Get current timestamp for exports"""
-        from datetime import datetime
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     def open_in_editor(self):
@@ -2019,278 +2345,60 @@ class SearchGUI(QMainWindow):
         self.save_settings()
         event.accept()
 
-def main_gui():
-    """Launch GUI mode"""
-    app = QApplication(sys.argv)
+def _get_app():
+    """The process-wide QApplication, created on first use"""
+    return QApplication.instance() or QApplication(sys.argv)
+
+def main_gui(warning=None):
+    """Launch GUI mode (returns the exit code), optionally showing a (title, text) warning once the window is up"""
+    app = _get_app()
     app.setStyle('Fusion')  # Modern style
     
     window = SearchGUI()
     window.show()
     
-    sys.exit(app.exec_())
-
-def generate_html_export(results, pattern, mode, path):
-    """Generate HTML export for CLI mode"""
-    import html
-    from datetime import datetime
-    
-    # Detect language from file extension for syntax highlighting
-    def detect_language(filename):
-        ext_map = {
-            '.py': 'python', '.js': 'javascript', '.ts': 'typescript',
-            '.cs': 'csharp', '.java': 'java', '.cpp': 'cpp', '.c': 'c',
-            '.go': 'go', '.rs': 'rust', '.php': 'php', '.rb': 'ruby',
-            '.swift': 'swift', '.kt': 'kotlin', '.html': 'html',
-            '.css': 'css', '.json': 'json', '.xml': 'xml'
-        }
-        import os
-        _, ext = os.path.splitext(filename)
-        return ext_map.get(ext.lower(), 'plaintext')
+    if warning:
+        QTimer.singleShot(0, lambda: QMessageBox.warning(window, *warning))
     
-    # Count unique files
-    unique_files = len(set(r['file'] for r in results))
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return app.exec_()
+
+def generate_html_export(results, pattern, mode, path, out=None):
+    """Generate HTML export for CLI mode (streamed to out when given)"""
+    parts = []
+    write = out.write if out is not None else parts.append
     
-    html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Search Results - {html.escape(pattern or 'N/A')}</title>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github-dark.min.css">
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/csharp.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/python.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/javascript.min.js"></script>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: #0d1117;
-            padding: 20px;
-            margin: 0;
-        }}
-        .container {{
-            max-width: 1600px;
-            margin: 0 auto;
-            background: #161b22;
-            border-radius: 10px;
-            box-shadow: 0 10px 40px rgba(0,0,0,0.5);
-            overflow: hidden;
-            border: 1px solid #30363d;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #1f6feb 0%, #8957e5 100%);
-            color: white;
-            padding: 30px;
-            border-bottom: 2px solid #58a6ff;
-        }}
-        .header h1 {{
-            margin: 0 0 20px 0;
-            font-size: 32px;
-            text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-        }}
-        .info {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-top: 20px;
-        }}
-        .info-item {{
-            background: rgba(255,255,255,0.15);
-            padding: 10px 15px;
-            border-radius: 5px;
-            backdrop-filter: blur(10px);
-        }}
-        .info-label {{
-            font-size: 12px;
-            opacity: 0.9;
-            margin-bottom: 5px;
-            color: #c9d1d9;
-        }}
-        .info-value {{
-            font-size: 18px;
-            font-weight: bold;
-            color: #ffffff;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 0;
-        }}
-        thead {{
-            background: #0d1117;
-            position: sticky;
-            top: 0;
-            z-index: 10;
-            border-bottom: 2px solid #58a6ff;
-        }}
-        th {{
-            padding: 15px;
-            text-align: left;
-            font-weight: 600;
-            color: #58a6ff;
-            border-bottom: 2px solid #30363d;
-        }}
-        tbody tr {{
-            border-bottom: 1px solid #21262d;
-            transition: all 0.2s;
-        }}
-        tbody tr:hover {{
-            background: #1c2128;
-            transform: scale(1.001);
-            box-shadow: 0 2px 8px rgba(88, 166, 255, 0.2);
-        }}
-        tbody tr:nth-child(even) {{
-            background: #161b22;
-        }}
-        tbody tr:nth-child(even):hover {{
-            background: #1c2128;
-        }}
-        td {{
-            padding: 12px 15px;
-            vertical-align: top;
-            color: #c9d1d9;
-        }}
-        .file-cell {{
-            color: #58a6ff;
-            font-weight: 500;
-            max-width: 450px;
-            word-break: break-all;
-            font-size: 13px;
-        }}
-        .line-cell {{
-            color: #a371f7;
-            font-weight: 700;
-            text-align: center;
-            width: 80px;
-            font-size: 14px;
-            background: #0d1117;
-            border-radius: 4px;
-        }}
-        .content-cell {{
-            font-family: 'Consolas', 'Courier New', monospace;
-            max-width: 700px;
-            overflow-x: auto;
-        }}
-        .content-cell pre {{
-            margin: 0;
-            padding: 0;
-            background: transparent !important;
-        }}
-        .content-cell code {{
-            padding: 8px 12px !important;
-            border-radius: 4px;
-            display: block;
-            font-size: 13px;
-            line-height: 1.5;
-            background: #0d1117 !important;
-            border: 1px solid #30363d;
-        }}
-        .hljs {{
-            background: #0d1117 !important;
-        }}
-        .stats {{
-            padding: 20px 30px;
-            background: #0d1117;
-            color: #c9d1d9;
-            text-align: center;
-            border-top: 2px solid #30363d;
-        }}
-        .match-highlight {{
-            background: #ffd700;
-            color: #000;
-            padding: 2px 4px;
-            border-radius: 2px;
-            font-weight: bold;
-        }}
-        ::-webkit-scrollbar {{
-            width: 12px;
-            height: 12px;
-        }}
-        ::-webkit-scrollbar-track {{
-            background: #0d1117;
-        }}
-        ::-webkit-scrollbar-thumb {{
-            background: #30363d;
-            border-radius: 6px;
-        }}
-        ::-webkit-scrollbar-thumb:hover {{
-            background: #484f58;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🔍 Search Results</h1>
-            <div class="info">
-                <div class="info-item">
-                    <div class="info-label">Pattern</div>
-                    <div class="info-value">{html.escape(pattern or 'N/A')}</div>
-                </div>
-                <div class="info-item">
-                    <div class="info-label">Mode</div>
-                    <div class="info-value">{html.escape(mode)}</div>
-                </div>
-                <div class="info-item">
-                    <div class="info-label">Total Matches</div>
-                    <div class="info-value">{len(results)}</div>
-                </div>
-                <div class="info-item">
-                    <div class="info-label">Files</div>
-                    <div class="info-value">{unique_files}</div>
-                </div>
-                <div class="info-item">
-                    <div class="info-label">Export Date</div>
-                    <div class="info-value">{timestamp}</div>
-                </div>
-            </div>
-        </div>
-        <table>
-            <thead>
-                <tr>
-                    <th>📁 File</th>
-                    <th>📍 Line</th>
-                    <th>💬 Content</th>
-                </tr>
-            </thead>
-            <tbody>
-"""
+    write(EXPORT_HTML_HEAD.substitute(
+        pattern=html_escape(pattern or 'N/A'),
+        mode=html_escape(mode),
+        total=len(results),
+        files=len(set(r['file'] for r in results)),
+        timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        content_heading='💬 Content',
+    ))
     
     # Add table rows
     for result in results:
-        file_path = html.escape(result['file'])
+        file_path = html_escape(result['file'])
         line_num = result['line_num'] if result['line_num'] > 0 else '-'
-        content = html.escape(result['line'])
+        content = html_escape(result['line'])
         
         # Detect language for syntax highlighting
         lang = detect_language(result['file'])
         
-        html_content += f"""                <tr>
+        write(f"""                <tr>
                     <td class="file-cell">{file_path}</td>
                     <td class="line-cell">{line_num}</td>
                     <td class="content-cell"><pre><code class="language-{lang}">{content}</code></pre></td>
                 </tr>
-"""
+""")
     
-    html_content += """            </tbody>
-        </table>
-        <div class="stats">
-            <p>Generated by Advanced Search Tool - CLI Mode</p>
-        </div>
-    </div>
-    <script>
-        hljs.highlightAll();
-    </script>
-</body>
-</html>"""
+    write(EXPORT_HTML_TAIL_CLI)
     
-    return html_content
+    if out is None:
+        return ''.join(parts)
 
 def main_cli(args):
     """Run CLI mode"""
-    import json
-    from datetime import datetime
-    
     # Create search instance
     searcher = AdvancedSearch()
     
@@ -2307,7 +2415,6 @@ def main_cli(args):
             context_lines=args.context
         )
     elif args.mode == 'filename':
-        from concurrent.futures import ThreadPoolExecutor
         worker = FilenameSearchWorker(
             args.pattern,
             [args.path] if args.path != '.' else [],
@@ -2317,7 +2424,6 @@ def main_cli(args):
         # Run synchronously in CLI mode
         worker.run()
         # Can't get signal results easily, so use direct ripgrep call
-        import subprocess
         cmd = ['rg', '--files']
         if args.pattern:
             cmd.extend(['--iglob', f'*{args.pattern}*'])
@@ -2347,12 +2453,9 @@ def main_cli(args):
     
     # Output results
     if args.output == 'html':
-        # Generate HTML output with proper encoding
-        html_content = generate_html_export(results, args.pattern, args.mode, args.path)
-        # Write to stdout with UTF-8 encoding
-        import sys
-        sys.stdout.reconfigure(encoding='utf-8')
-        print(html_content)
+        # Stream HTML straight to stdout (UTF-8, set up once in main)
+        generate_html_export(results, args.pattern, args.mode, args.path, out=sys.stdout)
+        print()
     elif args.output == 'json':
         print(json.dumps(results, indent=2))
     elif args.output == 'simple':
@@ -2374,31 +2477,8 @@ def main_cli(args):
         print(f"\n✅ Found {len(results)} results", file=sys.stderr)
     return 0 if results else 1
 
-def main():
-    """Main entry point - detect CLI or GUI mode"""
-    import argparse
-    import sys
-    import os
-    
-    # Check if any arguments provided (besides script name)
-    if len(sys.argv) > 1:
-        # Check for --help or -h first - show GUI help dialog if no console
-        if '--help' in sys.argv or '-h' in sys.argv:
-            # Try to detect if we have a console
-            try:
-                # Try writing to stdout
-                sys.stdout.write('')
-                sys.stdout.flush()
-                has_console = True
-            except:
-                has_console = False
-            
-            if not has_console:
-                # Show help in GUI dialog if no console
-                from PyQt5.QtWidgets import QApplication, QMessageBox, QTextEdit, QDialog, QVBoxLayout, QPushButton
-                app = QApplication(sys.argv)
-                
-                help_text = """🔍 Advanced Code Search - CLI/GUI Tool
+# Shown for -h/--help, on the console or in a dialog when there is none
+HELP_TEXT = """🔍 Advanced Code Search - CLI/GUI Tool
 
 USAGE:
     search.exe [pattern] [path] [options]
@@ -2436,117 +2516,238 @@ EXAMPLES:
 NOTE: For CLI mode, you must run this from a terminal/console.
 TIP: Run without arguments to open the GUI!
 """
-                
-                dialog = QDialog()
-                dialog.setWindowTitle("Advanced Search - Help")
-                dialog.resize(700, 600)
-                layout = QVBoxLayout()
-                
-                text_edit = QTextEdit()
-                text_edit.setPlainText(help_text)
-                text_edit.setReadOnly(True)
-                text_edit.setStyleSheet("""
-                    QTextEdit {
-                        background-color: #1e1e1e;
-                        color: #cccccc;
-                        font-family: 'Consolas', 'Courier New', monospace;
-                        font-size: 12px;
-                        padding: 10px;
-                    }
-                """)
-                layout.addWidget(text_edit)
-                
-                close_btn = QPushButton("Close")
-                close_btn.clicked.connect(dialog.accept)
-                close_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #0e639c;
-                        color: white;
-                        padding: 8px 16px;
-                        border-radius: 4px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background-color: #1177bb;
-                    }
-                """)
-                layout.addWidget(close_btn)
-                
-                dialog.setLayout(layout)
-                dialog.setStyleSheet("QDialog { background-color: #1e1e1e; }")
-                dialog.exec_()
-                return 0
-        
-        # Check if console is available for CLI operations
-        try:
-            sys.stdout.write('')
-            sys.stdout.flush()
-            has_console = True
-        except:
-            has_console = False
-        
-        if not has_console and '--gui' not in sys.argv:
-            # No console but CLI mode requested - show error and launch GUI
-            from PyQt5.QtWidgets import QApplication, QMessageBox
-            app = QApplication(sys.argv)
-            QMessageBox.warning(
-                None, 
-                "No Console Available",
-                "⚠️ CLI mode requires a console/terminal.\n\n"
-                "To use CLI mode:\n"
-                "1. Open Command Prompt or PowerShell\n"
-                "2. Run: search.exe [arguments]\n\n"
-                "Or build with 'Console Based' option in auto-py-to-exe.\n\n"
-                "Launching GUI mode instead..."
-            )
-            main_gui()
-            return 0
-        
-        # CLI mode
-        parser = argparse.ArgumentParser(
-            description='🔍 Advanced Code Search - CLI/GUI Tool',
-            epilog='Run without arguments to launch GUI mode'
-        )
-        
-        # Main arguments
-        parser.add_argument('pattern', nargs='?', help='Search pattern')
-        parser.add_argument('path', nargs='?', default='.', help='Path to search (default: current directory)')
-        
-        # Mode selection
-        parser.add_argument('-m', '--mode', choices=['content', 'filename', 'definition', 'usages', 'todos'],
-                          default='content', help='Search mode (default: content)')
-        
-        # Options
-        parser.add_argument('-i', '--ignore-case', action='store_true', help='Case-insensitive search')
-        parser.add_argument('-w', '--whole-word', action='store_true', help='Match whole words only')
-        parser.add_argument('-t', '--type', help='File type filter (e.g., py, js, cs)')
-        parser.add_argument('-C', '--context', type=int, default=0, help='Context lines (default: 0)')
-        parser.add_argument('-l', '--language', help='Language for definition search (auto-detect if not specified)')
-        parser.add_argument('-s', '--smart-locations', action='store_true', help='Search in smart locations (Desktop, Documents, etc.)')
-        
-        # Output format
-        parser.add_argument('-o', '--output', choices=['simple', 'detailed', 'json', 'html'],
-                          default='simple', help='Output format (default: simple)')
-        
-        # GUI flag
-        parser.add_argument('--gui', action='store_true', help='Force GUI mode')
-        
-        args = parser.parse_args()
-        
-        # Force GUI if --gui flag
-        if args.gui:
-            main_gui()
-        elif not args.pattern and args.mode != 'todos':
-            # No pattern provided and not todos mode - show help
-            parser.print_help()
-            print("\n💡 Tip: Run without arguments to launch GUI mode")
-            return 1
+# Console copy without the emoji: plain ASCII looks the same under any
+# code page or console font (the dialog keeps the rich version)
+HELP_TEXT_BYTES = HELP_TEXT.replace('🔍 ', '', 1).encode('utf-8')
+
+# CLI choices, shared by argparse and the fast scanner
+CLI_MODES = ('content', 'filename', 'definition', 'usages', 'todos')
+CLI_OUTPUTS = ('simple', 'detailed', 'json', 'html')
+
+# Flags the fast scanner understands; anything else is left to argparse
+CLI_SWITCHES = {
+    '-i': 'ignore_case', '--ignore-case': 'ignore_case',
+    '-w': 'whole_word', '--whole-word': 'whole_word',
+    '-s': 'smart_locations', '--smart-locations': 'smart_locations',
+    '--gui': 'gui',
+}
+CLI_OPTIONS = {
+    '-m': 'mode', '--mode': 'mode',
+    '-t': 'type', '--type': 'type',
+    '-C': 'context', '--context': 'context',
+    '-l': 'language', '--language': 'language',
+    '-o': 'output', '--output': 'output',
+}
+
+def _fast_parse(argv):
+    """Parse the common CLI shapes without argparse; None means use argparse"""
+    args = SimpleNamespace(
+        pattern=None, path='.', mode='content', ignore_case=False, whole_word=False,
+        type=None, context=0, language=None, smart_locations=False, output='simple', gui=False
+    )
+    positionals = []
+    tokens = iter(argv)
+    for token in tokens:
+        if token in CLI_SWITCHES:
+            setattr(args, CLI_SWITCHES[token], True)
+        elif token in CLI_OPTIONS:
+            value = next(tokens, None)
+            if value is None or value.startswith('-'):
+                return None  # Let argparse report the missing value
+            setattr(args, CLI_OPTIONS[token], value)
+        elif token.startswith('-'):
+            return None  # Combined/unknown flags, --opt=value, --
         else:
-            # CLI mode
-            return main_cli(args)
+            positionals.append(token)
+    
+    if len(positionals) > 2 or args.mode not in CLI_MODES or args.output not in CLI_OUTPUTS:
+        return None
+    try:
+        args.context = int(args.context)
+    except ValueError:
+        return None
+    
+    if positionals:
+        args.pattern = positionals[0]
+    if len(positionals) > 1:
+        args.path = positionals[1]
+    return args
+
+@lru_cache(maxsize=1)
+def _build_parser():
+    """Build the CLI argument parser (once per process)"""
+    import argparse  # Only the CLI needs it
+    parser = argparse.ArgumentParser(
+        description='🔍 Advanced Code Search - CLI/GUI Tool',
+        epilog='Run without arguments to launch GUI mode'
+    )
+    
+    # Main arguments
+    parser.add_argument('pattern', nargs='?', help='Search pattern')
+    parser.add_argument('path', nargs='?', default='.', help='Path to search (default: current directory)')
+    
+    # Mode selection
+    parser.add_argument('-m', '--mode', choices=CLI_MODES,
+                      default='content', help='Search mode (default: content)')
+    
+    # Options
+    parser.add_argument('-i', '--ignore-case', action='store_true', help='Case-insensitive search')
+    parser.add_argument('-w', '--whole-word', action='store_true', help='Match whole words only')
+    parser.add_argument('-t', '--type', help='File type filter (e.g., py, js, cs)')
+    parser.add_argument('-C', '--context', type=int, default=0, help='Context lines (default: 0)')
+    parser.add_argument('-l', '--language', help='Language for definition search (auto-detect if not specified)')
+    parser.add_argument('-s', '--smart-locations', action='store_true', help='Search in smart locations (Desktop, Documents, etc.)')
+    
+    # Output format
+    parser.add_argument('-o', '--output', choices=CLI_OUTPUTS,
+                      default='simple', help='Output format (default: simple)')
+    
+    # GUI flag
+    parser.add_argument('--gui', action='store_true', help='Force GUI mode')
+    
+    return parser
+
+# One stylesheet for the whole help dialog, parsed once when it is applied
+HELP_DIALOG_QSS = _minify_qss("""
+    QDialog#helpDialog {
+        background-color: #1e1e1e;
+    }
+    QDialog#helpDialog QTextEdit {
+        background-color: #1e1e1e;
+        color: #cccccc;
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 12px;
+        padding: 10px;
+    }
+    QDialog#helpDialog QPushButton {
+        background-color: #0e639c;
+        color: white;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QDialog#helpDialog QPushButton:hover {
+        background-color: #1177bb;
+    }
+""")
+
+def _has_console():
+    """Whether CLI output has somewhere to go (windowed launches have no stdout)"""
+    # Python 3 sets sys.stdout to None under pythonw and no-console builds;
+    # redirected output is not a tty but still counts, so no isatty() here
+    return sys.stdout is not None
+
+def _utf8_stdout():
+    """CLI output (emoji, HTML export, non-ASCII paths) is UTF-8 whatever the console default"""
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except AttributeError:
+        pass  # Replaced stdout without reconfigure()
+
+def _write_console_help():
+    """Write the help text to stdout"""
+    # Preformatted and pre-encoded: no argparse, no text-layer encode.
+    # The binary buffer (not os.write) keeps Windows' console stream,
+    # which turns the UTF-8 into wide characters itself
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is not None:
+        buffer.write(HELP_TEXT_BYTES)
+        buffer.flush()
+    else:
+        sys.stdout.write(HELP_TEXT_BYTES.decode('utf-8'))
+
+def _show_help():
+    """Print the help text, or show it in a dialog when there is no console"""
+    if _has_console():
+        _write_console_help()
+        return 0
+    
+    app = _get_app()
+    
+    dialog = QDialog()
+    dialog.setObjectName("helpDialog")
+    dialog.setWindowTitle("Advanced Search - Help")
+    dialog.resize(700, 600)
+    layout = QVBoxLayout()
+    
+    text_edit = QTextEdit()
+    text_edit.setPlainText(HELP_TEXT)
+    text_edit.setReadOnly(True)
+    layout.addWidget(text_edit)
+    
+    close_btn = QPushButton("Close")
+    close_btn.clicked.connect(dialog.accept)
+    layout.addWidget(close_btn)
+    
+    dialog.setLayout(layout)
+    dialog.setStyleSheet(HELP_DIALOG_QSS)
+    dialog.exec_()
+    return 0
+
+# Entry points for a lone argument, looked up before any other argv checks
+FAST_DISPATCH = {
+    '-h': _show_help,
+    '--help': _show_help,
+    '--gui': main_gui,
+}
+
+def _run_cli(argv):
+    """CLI path: console check, argument parsing, then the search itself"""
+    # Check if console is available for CLI operations
+    if not _has_console():
+        # No console but CLI mode requested - launch GUI and explain why
+        return main_gui(warning=(
+            "No Console Available",
+            "⚠️ CLI mode requires a console/terminal.\n\n"
+            "To use CLI mode:\n"
+            "1. Open Command Prompt or PowerShell\n"
+            "2. Run: search.exe [arguments]\n\n"
+            "Or build with 'Console Based' option in auto-py-to-exe.\n\n"
+            "Launching GUI mode instead..."
+        ))
+    
+    _utf8_stdout()
+    
+    args = _fast_parse(argv) or _build_parser().parse_args(argv)
+    
+    # Force GUI if --gui flag
+    if args.gui:
+        return main_gui()
+    elif not args.pattern and args.mode != 'todos':
+        # No pattern provided and not todos mode - show help
+        _write_console_help()
+        print("\nTip: Run without arguments to launch GUI mode")
+        return 1
     else:
-        # No arguments - launch GUI
-        main_gui()
+        return main_cli(args)
+
+def main():
+    """Main entry point - detect CLI or GUI mode"""
+    argv = sys.argv[1:]
+    
+    # No arguments - launch GUI
+    if not argv:
+        return main_gui()
+    
+    # Single-flag launches need none of the checks below
+    if len(argv) == 1 and argv[0] in FAST_DISPATCH:
+        return FAST_DISPATCH[argv[0]]()
+    
+    flags = frozenset(argv)
+    
+    # Check for --help or -h first - show GUI help dialog if no console
+    if '--help' in flags or '-h' in flags:
+        return _show_help()
+    
+    # --gui anywhere means GUI: no console check, no argument parsing
+    if '--gui' in flags:
+        return main_gui()
+    
+    return _run_cli(argv)
 
 if __name__ == '__main__':
-    sys.exit(main() or 0)
+    # In a frozen search.exe, spawned export workers re-run this entry point;
+    # this hands them to multiprocessing instead of opening another window
+    multiprocessing.freeze_support()
+    sys.exit(main())